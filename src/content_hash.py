@@ -0,0 +1,73 @@
+"""Content digests used to key caches."""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+try:
+    import blake3  # type: ignore
+
+    BLAKE3_SUPPORT = True
+except ImportError:
+    BLAKE3_SUPPORT = False
+
+
+def file_digest(path: Path) -> str:
+    """Compute the hex digest of a file's content.
+
+    Uses BLAKE3 over a memory map, hashing large files on several threads,
+    when the blake3 package is installed, and BLAKE2b otherwise. Digests
+    from the two differ in length, so keys built from one never match the
+    other.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Hex digest of the file content
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    if BLAKE3_SUPPORT:
+        hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        hasher.update_mmap(path)
+        return str(hasher.hexdigest())
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "blake2b").hexdigest()
+
+
+class DigestMemo:
+    """Digests of files already hashed, reused while a file is unchanged."""
+
+    def __init__(self) -> None:
+        """Initialize an empty memo."""
+        # Digest of each file, with the (size, mtime_ns) it was computed for
+        self._digests: Dict[Path, Tuple[Tuple[int, int], str]] = {}
+
+    def file_digest(self, path: Path, st: Optional[os.stat_result] = None) -> str:
+        """Compute a file's digest, or reuse the one from an earlier call.
+
+        When a stat result is given, a file whose size and modification time
+        are unchanged since it was last hashed is not read again.
+
+        Args:
+            path: Path to the file
+            st: Stat result for the file, if already known
+
+        Returns:
+            Hex digest of the file content
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        if st is None:
+            return file_digest(path)
+        signature = (st.st_size, st.st_mtime_ns)
+        known = self._digests.get(path)
+        if known is not None and known[0] == signature:
+            return known[1]
+        digest = file_digest(path)
+        self._digests[path] = (signature, digest)
+        return digest
@@ -0,0 +1,107 @@
+"""Persistent caching of attachment conversion results."""
+
+import json
+import logging
+import os
+from pathlib import Path
+import sqlite3
+import threading
+from typing import Any, Dict, Optional
+
+from .content_hash import DigestMemo
+
+logger = logging.getLogger(__name__)
+
+
+class ConversionCache:
+    """SQLite-backed cache of conversion results keyed by file content."""
+
+    def __init__(self, cbm_dir: Path, version: int = 1) -> None:
+        """Initialize the conversion cache.
+
+        Args:
+            cbm_dir: Directory for system files and processing
+            version: Result format version; entries from other versions are dropped
+        """
+        self.cache_path = Path(cbm_dir) / "conversion_cache.sqlite3"
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.version = version
+        self._digests = DigestMemo()
+        # The connection is shared by worker threads
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.cache_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS conversions ("
+            "key TEXT PRIMARY KEY, version INTEGER NOT NULL, payload TEXT NOT NULL)"
+        )
+        self._conn.execute("DELETE FROM conversions WHERE version != ?", (version,))
+        self._conn.commit()
+
+    def key_for(
+        self,
+        file_path: Path,
+        file_type: str,
+        st: Optional[os.stat_result] = None,
+    ) -> Optional[str]:
+        """Build the cache key for a file.
+
+        The key combines the digest of the file content with the file
+        type and name, since the formatted result embeds the file name.
+
+        Args:
+            file_path: Path to the file
+            file_type: File type the result was produced for
+            st: Stat result for the file, if already known
+
+        Returns:
+            Cache key, or None if the file cannot be read
+        """
+        try:
+            digest = self._digests.file_digest(file_path, st)
+        except OSError:
+            return None
+        return f"{digest}:{file_type}:{file_path.name}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached conversion result.
+
+        Args:
+            key: Cache key from key_for
+
+        Returns:
+            Cached result dictionary, or None if not cached
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM conversions WHERE key = ?", (key,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        """Cache a conversion result.
+
+        Args:
+            key: Cache key from key_for
+            result: Conversion result dictionary
+        """
+        payload = json.dumps(result)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO conversions (key, version, payload) "
+                "VALUES (?, ?, ?)",
+                (key, self.version, payload),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            self._conn.close()
+
+    def cleanup(self) -> None:
+        """Remove the cache database."""
+        try:
+            self.close()
+            self.cache_path.unlink(missing_ok=True)
+        except Exception as e:
+            logger.warning(f"Error cleaning up conversion cache: {e}")
@@ -3,6 +3,7 @@
 import base64
 import logging
 from pathlib import Path
+import shutil
 from typing import Optional, Set
 
 from openai import OpenAI
@@ -370,16 +371,9 @@ class ImageConverter:
     def cleanup(self) -> None:
         """Clean up temporary files."""
         self.cache.cleanup()
-        try:
-            if self.temp_dir.exists():
-                for file in self.temp_dir.iterdir():
-                    try:
-                        file.unlink()
-                    except Exception as e:
-                        logger.debug(f"Error deleting file {file}: {e}")
-                self.temp_dir.rmdir()
-        except Exception as e:
-            logger.debug(f"Error cleaning up temporary directory: {e}")
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        if self.temp_dir.exists():
+            logger.debug(f"Error cleaning up temporary directory: {self.temp_dir}")
 
     def __del__(self) -> None:
         """Clean up on deletion."""
@@ -1,23 +1,39 @@
 """Image analysis caching functionality."""
 
 import logging
+import os
 from pathlib import Path
+import shutil
+import sqlite3
+import threading
 from typing import Optional
 
+from .content_hash import DigestMemo
+
 logger = logging.getLogger(__name__)
 
 
 class ImageCache:
     """Cache for image analysis results."""
 
-    def __init__(self, cbm_dir: Path) -> None:
+    def __init__(self, cbm_dir: Path, model: str = "gpt-4o") -> None:
         """Initialize the image cache.
 
         Args:
             cbm_dir: Directory for system files and processing
+            model: Vision model whose descriptions are cached
         """
         self.cache_dir = Path(cbm_dir) / "image_cache"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.model = model
+
+        # Descriptions are keyed by model and content, and kept across runs
+        # and cleanups. The connection is opened on first use, since many
+        # callers never look up a description, and is shared by worker threads.
+        self.descriptions_path = Path(cbm_dir) / "image_descriptions.sqlite3"
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._digests = DigestMemo()
 
     def is_processed(self, image_path: Path) -> bool:
         """Check if an image has been processed.
@@ -53,6 +69,91 @@ class ImageCache:
         cache_path = self._get_cache_path(image_path)
         cache_path.write_text(analysis)
 
+    def get_description(
+        self, image_path: Path, st: Optional[os.stat_result] = None
+    ) -> Optional[str]:
+        """Get the stored description for an image's content.
+
+        Args:
+            image_path: Path to the image file
+            st: Stat result for the file, if already known
+
+        Returns:
+            Description text, or None if this content has not been described
+        """
+        key = self._get_description_key(image_path, st)
+        if key is None:
+            return None
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT description FROM descriptions WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_description(
+        self,
+        image_path: Path,
+        description: str,
+        st: Optional[os.stat_result] = None,
+    ) -> None:
+        """Store the description for an image's content.
+
+        Args:
+            image_path: Path to the image file
+            description: Description text to store
+            st: Stat result for the file, if already known
+        """
+        key = self._get_description_key(image_path, st)
+        if key is None:
+            return
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO descriptions (key, description) VALUES (?, ?)",
+                (key, description),
+            )
+            conn.commit()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get the description database connection, opening it if needed.
+
+        Must be called with the lock held.
+
+        Returns:
+            Open connection to the description database
+        """
+        if self._conn is None:
+            self._conn = sqlite3.connect(
+                self.descriptions_path, check_same_thread=False
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS descriptions ("
+                "key TEXT PRIMARY KEY, description TEXT NOT NULL)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def _get_description_key(
+        self, image_path: Path, st: Optional[os.stat_result] = None
+    ) -> Optional[str]:
+        """Get the description key for an image's content.
+
+        Args:
+            image_path: Path to the image file
+            st: Stat result for the file, if already known
+
+        Returns:
+            Model name plus digest of the image bytes, or None if the
+            file cannot be read
+        """
+        try:
+            digest = self._digests.file_digest(image_path, st)
+        except OSError:
+            return None
+        return f"{self.model}:{digest}"
+
     def _get_cache_path(self, image_path: Path) -> Path:
         """Get the cache file path for an image.
 
@@ -66,15 +167,16 @@ class ImageCache:
         cache_key = str(image_path.resolve()).__hash__()
         return self.cache_dir / f"{cache_key}.txt"
 
+    def close(self) -> None:
+        """Close the description database if it was opened."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
     def cleanup(self) -> None:
-        """Clean up cache files."""
-        try:
-            if self.cache_dir.exists():
-                for file in self.cache_dir.iterdir():
-                    try:
-                        file.unlink()
-                    except Exception as e:
-                        logger.warning(f"Failed to delete cache file {file}: {e}")
-                self.cache_dir.rmdir()
-        except Exception as e:
-            logger.warning(f"Error cleaning up cache directory: {e}")
+        """Clean up cache files and close the description database."""
+        self.close()
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        if self.cache_dir.exists():
+            logger.warning(f"Failed to delete cache directory {self.cache_dir}")
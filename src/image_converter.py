@@ -3,14 +3,27 @@
 import logging
 from pathlib import Path
 import platform
+import shutil
 import subprocess
 from typing import Optional
-
-from PIL import Image
+import weakref
 
 logger = logging.getLogger(__name__)
 
 
+def _remove_temp_dir(temp_dir: Path) -> None:
+    """Delete a converter's temporary directory and the files in it.
+
+    Args:
+        temp_dir: Temporary directory to remove
+    """
+    shutil.rmtree(temp_dir, ignore_errors=True)
+    if temp_dir.exists():
+        logger.warning("Failed to delete temporary directory %s", temp_dir)
+    else:
+        logger.debug("Deleted temporary directory")
+
+
 class ImageConverter:
     """Handles image format conversion and optimization."""
 
@@ -23,6 +36,8 @@ class ImageConverter:
         self.cbm_dir = Path(cbm_dir)
         self.temp_dir = self.cbm_dir / "temp"
         self.temp_dir.mkdir(parents=True, exist_ok=True)
+        # Runs once, on cleanup() or when the converter is collected
+        self._finalizer = weakref.finalize(self, _remove_temp_dir, self.temp_dir)
 
     def convert_to_png(self, input_path: Path, output_path: Path) -> bool:
         """Convert any image format to PNG.
@@ -52,6 +67,8 @@ class ImageConverter:
                     return False
 
             # Use PIL for other formats
+            from PIL import Image
+
             with Image.open(input_path) as img:
                 # Convert to RGB if necessary
                 if img.mode in ("RGBA", "LA") or (
@@ -136,6 +153,8 @@ class ImageConverter:
             if output_path is None:
                 output_path = self.temp_dir / f"{image_path.stem}.png"
 
+            from PIL import Image
+
             with Image.open(image_path) as img:
                 # Convert to RGB if needed
                 if img.mode in ("RGBA", "LA"):
@@ -155,25 +174,4 @@ class ImageConverter:
 
     def cleanup(self) -> None:
         """Clean up temporary files."""
-        try:
-            if self.temp_dir.exists():
-                try:
-                    for file in self.temp_dir.iterdir():
-                        try:
-                            file.unlink()
-                        except Exception as e:
-                            logger.warning("Failed to delete file %s: %s", file, e)
-                    self.temp_dir.rmdir()
-                    logger.debug("Deleted temporary directory")
-                except Exception as e:
-                    logger.warning(
-                        "Failed to delete temporary directory %s: %s", self.temp_dir, e
-                    )
-        except Exception as e:
-            logger.warning(
-                "Error cleaning up temporary directory %s: %s", self.temp_dir, e
-            )
-
-    def __del__(self) -> None:
-        """Clean up on deletion."""
-        self.cleanup()
+        self._finalizer()
@@ -11,7 +11,11 @@ from tqdm import tqdm  # type: ignore
 from .converter_factory import ConverterFactory
 from .file_manager import FileManager
 from .file_system import FileSystem, MarkdownFile
-from .reference_match import ReferenceMatch, find_markdown_references
+from .reference_match import (
+    ReferenceMatch,
+    find_markdown_references,
+    iter_markdown_references,
+)
 from .processing_stats import ProcessingStats, ErrorType
 from .logging_utils import log_timing, log_block_timing
 from .progress_manager import ProgressManager
@@ -143,14 +147,15 @@ class MarkdownProcessorV2:
 
         # Check for references in the file
         content = md_file.md_path.read_text()
-        refs = find_markdown_references(content)
+        # Only whether the file has any reference matters here
+        has_refs = next(iter_markdown_references(content), None) is not None
 
         # If file has references but no attachment directory, skip it
-        if refs and not md_file.attachment_dir:
+        if has_refs and not md_file.attachment_dir:
             return False
 
         # For files without references and no attachment dir, always process
-        if not refs and not md_file.attachment_dir:
+        if not has_refs and not md_file.attachment_dir:
             return True
 
         # File has references or attachment dir but is not newer than output
@@ -238,7 +243,7 @@ class MarkdownProcessorV2:
         """Find embedded references in a markdown file."""
         with open(md_path, 'r') as f:
             content = f.read()
-        return [ref for ref in find_markdown_references(content) if ref.embed]
+        return [ref for ref in iter_markdown_references(content) if ref.embed]
 
     @log_timing
     def process_markdown_file(self, md_file: MarkdownFile) -> Optional[dict]:
@@ -1,25 +1,63 @@
 """MarkItDown wrapper with standardized output formats."""
 
+import asyncio
 import base64
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+import functools
+import hashlib
+import importlib.util
+import io
 import json
 import logging
+import mimetypes
+import mmap
+import multiprocessing.util
 import os
 from pathlib import Path
+import random
+import re
+import shutil
+import struct
+import tempfile
+import threading
 import time
-from typing import Any, Dict, List, Optional, TypedDict, Union
-
-from bs4 import BeautifulSoup
-import fitz  # type: ignore
-from openai import OpenAI
-from openai.types.chat import ChatCompletionMessageParam
-import pandas as pd
-from PIL import Image
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypedDict,
+    cast,
+)
+import urllib.request
+
+from openai import (
+    APIConnectionError,
+    AsyncOpenAI,
+    DefaultAsyncHttpxClient,
+    InternalServerError,
+    OpenAI,
+    RateLimitError,
+)
+from openai.types.chat import ChatCompletion, ChatCompletionMessageParam
 
 from markitdown import MarkItDown  # type: ignore
 
+try:
+    import orjson
+
+    ORJSON_SUPPORT = True
+except ImportError:
+    ORJSON_SUPPORT = False
+
+from .conversion_cache import ConversionCache
 from .image_cache import ImageCache
 from .image_converter import ImageConverter
-from .logging_utils import log_timing, log_block_timing
+from .logging_utils import log_block_timing, log_timing
+from .rate_limiter import RateLimiter
 
 # Configure OpenAI loggers to not show debug messages
 logging.getLogger("openai").setLevel(logging.INFO)
@@ -28,6 +66,118 @@ logging.getLogger("pdfminer.cmapdb").setLevel(logging.INFO)
 
 logger = logging.getLogger(__name__)
 
+# Model used for image descriptions and LLM-backed document conversion
+VISION_MODEL = "gpt-4o"
+
+# Bump when the formatted conversion output changes to invalidate cached results
+FORMAT_VERSION = 3
+
+# Encodings tried, in order, when decoding text attachments; latin1 accepts
+# any byte sequence, so nothing after it would ever be tried
+TEXT_ENCODINGS = ("utf-8", "latin1")
+
+# File type for each known extension; anything else is treated as a document
+EXTENSION_FILE_TYPES: Dict[str, str] = {
+    ".jpg": "image",
+    ".jpeg": "image",
+    ".png": "image",
+    ".gif": "image",
+    ".webp": "image",
+    ".heic": "image",
+    ".heif": "image",
+    ".svg": "image",
+    ".xlsx": "spreadsheet",
+    ".xls": "spreadsheet",
+    ".csv": "spreadsheet",
+    ".docx": "document",
+    ".doc": "document",
+    ".rtf": "document",
+    ".pdf": "pdf",
+    ".html": "html",
+    ".htm": "html",
+    ".json": "json",
+    ".txt": "text",
+    ".py": "code",
+    ".js": "code",
+    ".java": "code",
+    ".cpp": "code",
+}
+
+FILE_TYPE_EMOJIS: Dict[str, str] = {
+    "document": "📄",
+    "spreadsheet": "📊",
+    "image": "🖼️",
+    "code": "",
+    "pdf": "📑",
+    "text": "📝",
+    "html": "🌐",
+    "json": "📋",
+}
+
+# HTML parsers are only probed here and imported on first use, since most
+# runs convert few or no HTML attachments
+SELECTOLAX_SUPPORT = importlib.util.find_spec("selectolax") is not None
+LXML_SUPPORT = importlib.util.find_spec("lxml") is not None
+
+# Documents with a <body> element; only the title and body are kept when
+# falling back to BeautifulSoup
+HTML_BODY_RE = re.compile(r"<body[\s>]", re.IGNORECASE)
+
+# Elements whose content is never shown as page text
+HTML_SKIPPED_TAGS = ("script", "style", "noscript", "template")
+
+# JSON attachments above this size are embedded as-is instead of re-serialized
+LARGE_JSON_BYTES = 10 * 1024 * 1024
+
+# orjson reads integers beyond 64 bits as floats, losing digits, so documents
+# with a run of this many digits are parsed with the json module instead
+ORJSON_MAX_DIGITS_RE = re.compile(rb"\d{20}")
+
+# CSVs are parsed with pyarrow's multithreaded reader when it is installed,
+# falling back to the C engine for input pyarrow reads differently. Above
+# LARGE_SPREADSHEET_BYTES they are parsed with the C engine in chunks and
+# rendered chunk by chunk, so no DataFrame of the whole file is built; the
+# file text and the joined markdown are still held in full.
+CSV_ENGINE = "pyarrow" if importlib.util.find_spec("pyarrow") else "c"
+LARGE_SPREADSHEET_BYTES = 20 * 1024 * 1024
+SPREADSHEET_CHUNK_ROWS = 10_000
+
+# pyarrow reads integers beyond 64 bits as floats, where the C engine keeps
+# their digits, so CSVs with a run of this many digits skip pyarrow
+CSV_LONG_DIGITS_RE = re.compile(r"[0-9]{20}")
+
+# Workbooks are read with the Rust calamine reader when python-calamine is
+# installed, otherwise with pandas' default engine
+EXCEL_ENGINE = "calamine" if importlib.util.find_spec("python_calamine") else None
+
+# Pillow is imported on first use, and pillow_heif is only registered with
+# it then, since many runs never open an image
+HEIF_SUPPORT = importlib.util.find_spec("pillow_heif") is not None
+_heif_registered = False
+
+# HTTP/2 multiplexes concurrent vision requests over one connection; httpx
+# only supports it when the h2 package is installed
+HTTP2_SUPPORT = importlib.util.find_spec("h2") is not None
+
+# PDFs with at least this many pages have their text extracted in worker
+# processes; PyMuPDF documents are not safe to share between threads
+PDF_PARALLEL_MIN_PAGES = 64
+PDF_MAX_WORKERS = 4
+
+# PyMuPDF is not thread-safe even across documents, so in-process calls are
+# serialized when files are converted from several threads
+_FITZ_LOCK = threading.Lock()
+
+# Upper bound on worker threads used by convert_files
+CONVERT_MAX_WORKERS = 8
+
+# Start method for worker processes. Forking would copy this process while its
+# threads may be inside sqlite or PyMuPDF, so workers come from a fork server,
+# or are spawned where that is unavailable.
+_PROCESS_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
 
 class DocumentConverterResult(TypedDict, total=False):
     """Type hints for MarkItDown conversion result."""
@@ -90,45 +240,440 @@ def create_success_result(
     }
 
 
+# Transient OpenAI failures worth retrying; auth and request errors are not
+RETRYABLE_OPENAI_ERRORS = (RateLimitError, APIConnectionError, InternalServerError)
+
+# Tokens an image request is assumed to count against a TPM limit: a
+# high-detail image within MAX_IMAGE_SIDE costs at most 1445 input tokens,
+# plus the prompt and a typical description
+VISION_REQUEST_TOKENS = 2000
+
+# Images described per request by process_images_batch; more would push the
+# request body toward the API's 20 MB limit
+IMAGE_BATCH_MAX = 4
+
+# Line that starts each image's description in a batched response
+IMAGE_DELIMITER_RE = re.compile(r"^=== IMAGE (\d+) ===[ \t]*$", re.MULTILINE)
+
+# Seconds to wait for an image upload before sending the image inline
+IMAGE_UPLOAD_TIMEOUT = 30
+
+# Longest side sent to the vision API; larger images, and non-JPEG files of
+# at least REENCODE_MIN_BYTES, are downscaled and re-encoded as JPEG first.
+# JPEGs within the limit are sent as-is, since re-encoding gains little.
+MAX_IMAGE_SIDE = 2048
+REENCODE_MIN_BYTES = 500 * 1024
+JPEG_QUALITY = 85
+
+# Raw image files larger than this are base64-encoded from an mmap; for
+# smaller files a plain read is cheaper than setting up the mapping
+MMAP_MIN_BYTES = 4 * 1024 * 1024
+
+# JPEG start-of-frame markers that carry the image dimensions
+JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _read_jpeg_size(f: BinaryIO) -> Optional[Tuple[int, int]]:
+    """Scan JPEG segments for the start-of-frame header.
+
+    Args:
+        f: Binary file positioned just after the SOI marker
+
+    Returns:
+        (width, height) tuple, or None if no frame header was found
+    """
+    while True:
+        marker = f.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None
+        while marker[1] == 0xFF:  # Fill bytes before the marker code
+            marker = marker[1:] + f.read(1)
+        length_bytes = f.read(2)
+        if len(length_bytes) < 2:
+            return None
+        length = struct.unpack(">H", length_bytes)[0]
+        if marker[1] in JPEG_SOF_MARKERS:
+            frame = f.read(5)
+            if len(frame) < 5:
+                return None
+            height, width = struct.unpack(">HH", frame[1:5])
+            return width, height
+        f.seek(length - 2, os.SEEK_CUR)
+
+
+def _open_image(file_path: Path) -> Any:
+    """Open an image with Pillow, importing it on first use.
+
+    The HEIC/HEIF opener is registered with Pillow on the first call when
+    pillow_heif is installed.
+
+    Args:
+        file_path: Path to the image file
+
+    Returns:
+        Opened PIL image
+    """
+    global _heif_registered
+    from PIL import Image
+
+    if HEIF_SUPPORT and not _heif_registered:
+        from pillow_heif import register_heif_opener  # type: ignore
+
+        register_heif_opener()
+        _heif_registered = True
+    return Image.open(file_path)
+
+
+def _all_results(
+    results: List[Optional[Dict[str, Any]]],
+) -> List[Dict[str, Any]]:
+    """Check that a batch produced a result for every input.
+
+    Args:
+        results: Results in input order, None where none was produced
+
+    Returns:
+        The same results
+
+    Raises:
+        RuntimeError: If any result is missing
+    """
+    missing = sum(result is None for result in results)
+    if missing:
+        raise RuntimeError(f"{missing} of {len(results)} results were not produced")
+    return cast(List[Dict[str, Any]], results)
+
+
+def _split_batch_response(content: str, count: int) -> Optional[List[str]]:
+    """Split a batched description response on its image delimiters.
+
+    Args:
+        content: Response text with one delimited section per image
+        count: Number of images in the request
+
+    Returns:
+        One description per image, or None if the response does not have a
+        non-empty section for each image, in order
+    """
+    parts = IMAGE_DELIMITER_RE.split(content)
+    # Alternating image numbers and section text after any preamble
+    if parts[1::2] != [str(n) for n in range(1, count + 1)]:
+        return None
+    descriptions = [part.strip() for part in parts[2::2]]
+    return descriptions if all(descriptions) else None
+
+
+def _flatten_image(img: Any) -> Any:
+    """Convert a PIL image to RGB, compositing transparency onto white.
+
+    Args:
+        img: PIL image in any mode
+
+    Returns:
+        RGB PIL image
+    """
+    from PIL import Image
+
+    if img.mode in ("RGBA", "LA", "PA") or (
+        img.mode == "P" and "transparency" in img.info
+    ):
+        rgba = img.convert("RGBA")
+        background = Image.new("RGB", img.size, (255, 255, 255))
+        background.paste(rgba, mask=rgba.getchannel("A"))
+        return background
+    if img.mode != "RGB":
+        return img.convert("RGB")
+    return img
+
+
+def read_image_size(file_path: Path) -> Optional[Tuple[int, int]]:
+    """Read image dimensions from the file header without decoding pixels.
+
+    PNG, GIF and JPEG headers are parsed directly; other formats fall back
+    to PIL, which only parses the header on open.
+
+    Args:
+        file_path: Path to the image file
+
+    Returns:
+        (width, height) tuple, or None if the dimensions could not be read
+    """
+    try:
+        with open(file_path, "rb") as f:
+            header = f.read(24)
+            if header.startswith(b"\x89PNG\r\n\x1a\n") and header[12:16] == b"IHDR":
+                width, height = struct.unpack(">II", header[16:24])
+                return width, height
+            if header[:6] in (b"GIF87a", b"GIF89a"):
+                width, height = struct.unpack("<HH", header[6:10])
+                return width, height
+            if header.startswith(b"\xff\xd8"):
+                f.seek(2)
+                size = _read_jpeg_size(f)
+                if size is not None:
+                    return size
+
+        with _open_image(file_path) as img:
+            return img.width, img.height
+    except Exception:
+        return None
+
+
+# Number of (client, model) pairs whose MarkItDown instance is kept for reuse
+# across wrappers; each cached entry also keeps its client and connection pool
+MARKITDOWN_CACHE_SIZE = 8
+
+
+@functools.lru_cache(maxsize=MARKITDOWN_CACHE_SIZE)
+def _get_markitdown(client: OpenAI, model: str) -> MarkItDown:
+    """Get the shared MarkItDown instance for a client and model.
+
+    Clients are compared by identity. Concurrent first calls for the same
+    pair may each build an instance, but only one is kept.
+
+    Args:
+        client: OpenAI client instance
+        model: Model used for LLM-backed conversions
+
+    Returns:
+        MarkItDown instance
+    """
+    return MarkItDown(llm_client=client, llm_model=model)
+
+
+def clear_markitdown_cache() -> None:
+    """Drop the shared MarkItDown instances and the clients they keep alive."""
+    _get_markitdown.cache_clear()
+
+
+def _write_pdf_text(doc: Any, start: int, stop: int, buffer: io.StringIO) -> None:
+    """Write the text of a range of PDF pages, separated by blank lines.
+
+    Pages are loaded by index so each one can be freed before the next, and
+    the MuPDF CID fallback for unmapped glyphs is skipped.
+
+    Args:
+        doc: Open PyMuPDF document
+        start: Index of the first page to extract
+        stop: Index one past the last page to extract
+        buffer: Buffer the text is written to
+    """
+    import fitz  # type: ignore
+
+    flags = (
+        fitz.TEXT_PRESERVE_LIGATURES
+        | fitz.TEXT_PRESERVE_WHITESPACE
+        | fitz.TEXT_MEDIABOX_CLIP
+    )
+    for i in range(start, stop):
+        if i > start:
+            buffer.write("\n\n")
+        buffer.write(doc.load_page(i).get_text("text", flags=flags))
+
+
+def _extract_pdf_pages(path: str, start: int, stop: int) -> str:
+    """Extract the text of a range of PDF pages.
+
+    Opens its own document so it can run in a worker process.
+
+    Args:
+        path: Path to the PDF file
+        start: Index of the first page to extract
+        stop: Index one past the last page to extract
+
+    Returns:
+        Text of the pages in the range, separated by blank lines
+    """
+    import fitz  # type: ignore
+
+    buffer = io.StringIO()
+    with fitz.open(path) as doc:
+        _write_pdf_text(doc, start, stop, buffer)
+    return buffer.getvalue()
+
+
+# Wrapper used by this process when it is a convert_files worker
+_WORKER_WRAPPER: Optional["MarkItDownWrapper"] = None
+
+
+def _init_convert_worker(
+    api_key: str, organization: Optional[str], base_url: str
+) -> None:
+    """Set up a convert_files worker process.
+
+    The worker gets its own client and a wrapper in a private directory that
+    is removed when the process exits; caching stays in the parent process.
+
+    Args:
+        api_key: OpenAI API key
+        organization: OpenAI organization, if any
+        base_url: OpenAI API base URL
+    """
+    global _WORKER_WRAPPER
+    cbm_dir = tempfile.mkdtemp(prefix="cbm-worker-")
+    multiprocessing.util.Finalize(
+        None, shutil.rmtree, args=(cbm_dir, True), exitpriority=1
+    )
+    client = OpenAI(api_key=api_key, organization=organization, base_url=base_url)
+    _WORKER_WRAPPER = MarkItDownWrapper(client, cbm_dir=cbm_dir)
+
+
+def _convert_in_worker(
+    file_path: Path, file_type: str, st: Optional[os.stat_result]
+) -> Dict[str, Any]:
+    """Convert a non-image file in a convert_files worker process.
+
+    Args:
+        file_path: Path to the file to convert
+        file_type: File type from _get_file_type
+        st: Stat result for the file, if known
+
+    Returns:
+        Conversion result with standardized format
+    """
+    if _WORKER_WRAPPER is None:
+        raise RuntimeError("convert_files worker was not initialized")
+    return _WORKER_WRAPPER._convert_by_type(file_path, file_type, st=st)
+
+
 class MarkItDownWrapper:
     """Wrapper for MarkItDown with standardized output formats."""
 
-    def __init__(self, client: OpenAI, *, cbm_dir: str | Path) -> None:
+    _DETAILS_TEMPLATE = (
+        "<!-- BEGIN EMBEDDED CONTENT -->\n"
+        '<details class="embedded-content">\n'
+        "<summary>{emoji} {filename} ({size}, modified {mtime})</summary>\n"
+        "\n"
+        "{content}\n"
+        "\n"
+        "</details>\n"
+        "<!-- END EMBEDDED CONTENT -->"
+    )
+
+    # Plain heading and body used for spreadsheet and HTML content
+    _FILE_CONTENT_TEMPLATE = "### File Content: {filename}\n\n{content}\n"
+
+    # Image suffixes that need HEIC handling or can be sent to GPT-4o as-is
+    _HEIC_EXTENSIONS = frozenset({".heic", ".heif"})
+    _JPEG_EXTENSIONS = frozenset({".jpg", ".jpeg"})
+    _OAI_NATIVE_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".gif", ".webp"})
+
+    # Handler method for each non-image file type; each takes (file_path, st)
+    _TYPE_HANDLERS: Dict[str, str] = {
+        "pdf": "_handle_pdf_file",
+        "document": "_handle_document_file",
+        "spreadsheet": "_handle_spreadsheet_file",
+        "html": "_handle_html_file",
+        "json": "_handle_json_file",
+        "text": "_handle_text_file",
+    }
+
+    def __init__(
+        self,
+        client: OpenAI,
+        *,
+        cbm_dir: str | Path,
+        async_client: Optional[AsyncOpenAI] = None,
+        image_upload_url: Optional[str] = None,
+        max_requests_per_minute: Optional[float] = None,
+        max_tokens_per_minute: Optional[float] = None,
+    ) -> None:
         """Initialize wrapper with OpenAI client.
 
         Args:
             client: OpenAI client instance
             cbm_dir: Directory for system files and processing
+            async_client: Async OpenAI client for batched image requests;
+                created from the client's settings on first use if omitted
+            image_upload_url: Base URL that images are PUT to and that the
+                API can fetch them from; images are inlined as base64 if omitted
+            max_requests_per_minute: GPT-4o request rate to stay under
+            max_tokens_per_minute: GPT-4o token rate to stay under
         """
         self.client = client
+        self._async_client = async_client
+        # Event loop that a client created by aclient is bound to; None when
+        # the caller supplied the client, which aclose then leaves open
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.image_upload_url = image_upload_url
         self.max_retries = 3
-        self.retry_delay = 1
+        self.retry_delay = 0.2
+        self.max_retry_delay = 30.0
+        self.rate_limiter = RateLimiter(max_requests_per_minute, max_tokens_per_minute)
         self.cbm_dir = Path(cbm_dir)
-        self.image_cache = ImageCache(cbm_dir=self.cbm_dir)
+        self.image_cache = ImageCache(cbm_dir=self.cbm_dir, model=VISION_MODEL)
+        self.conversion_cache = ConversionCache(self.cbm_dir, version=FORMAT_VERSION)
         self.image_converter = ImageConverter(cbm_dir=self.cbm_dir)
-        self.markitdown = MarkItDown(llm_client=client, llm_model="gpt-4o")
         logger.debug("MarkItDownWrapper initialized with cbm_dir: %s", self.cbm_dir)
         self.temp_dir = self.cbm_dir / "temp"
         self.temp_dir.mkdir(parents=True, exist_ok=True)
         self.temp_images = self.temp_dir / "temp_images"
         self.temp_images.mkdir(parents=True, exist_ok=True)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._process_executor: Optional[ProcessPoolExecutor] = None
 
-    def _handle_pdf_file(self, file_path: Path) -> Dict[str, Any]:
+    @property
+    def aclient(self) -> AsyncOpenAI:
+        """Async OpenAI client, created from the sync client's settings if needed.
+
+        A created client's connection pool only works on the event loop it
+        was first used on, so a new one is created for each running loop,
+        e.g. for every asyncio.run call.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client_loop not in (None, loop):
+            # The old client belongs to another loop, so it cannot be closed here
+            self._async_client = None
+        if self._async_client is None:
+            self._async_client = AsyncOpenAI(
+                api_key=self.client.api_key,
+                organization=self.client.organization,
+                base_url=self.client.base_url,
+                http_client=DefaultAsyncHttpxClient(http2=HTTP2_SUPPORT),
+            )
+            self._async_client_loop = loop
+        return self._async_client
+
+    @property
+    def markitdown(self) -> MarkItDown:
+        """Shared MarkItDown instance for this client, created on first use."""
+        return _get_markitdown(self.client, VISION_MODEL)
+
+    def _handle_pdf_file(
+        self, file_path: Path, st: Optional[os.stat_result] = None
+    ) -> Dict[str, Any]:
         """Handle PDF file conversion using PyMuPDF."""
+        import fitz  # type: ignore
+
         try:
             # Open the PDF
-            doc = fitz.open(str(file_path))
-            text_content = []
-
-            # Extract text from each page
-            for page in doc:
-                text_content.append(page.get_text())  # type: ignore
-
-            # Close the document
-            doc.close()
+            workers = min(os.cpu_count() or 1, PDF_MAX_WORKERS)
+            with _FITZ_LOCK, fitz.open(str(file_path)) as doc:
+                page_count = doc.page_count
+                parallel = workers > 1 and page_count >= PDF_PARALLEL_MIN_PAGES
+                if not parallel:
+                    buffer = io.StringIO()
+                    _write_pdf_text(doc, 0, page_count, buffer)
+                    text_content = buffer.getvalue()
+
+            # Split long PDFs into one contiguous page range per worker
+            if parallel:
+                step = -(-page_count // workers)
+                starts = range(0, page_count, step)
+                stops = [min(start + step, page_count) for start in starts]
+                with ProcessPoolExecutor(
+                    max_workers=workers, mp_context=_PROCESS_CONTEXT
+                ) as executor:
+                    chunks = executor.map(
+                        _extract_pdf_pages,
+                        [str(file_path)] * len(starts),
+                        starts,
+                        stops,
+                    )
+                    text_content = "\n\n".join(chunks)
 
             return {
-                "text_content": "\n\n".join(text_content),
+                "text_content": text_content,
                 "success": True,
                 "type": "pdf",
                 "content": None,
@@ -160,48 +705,147 @@ class MarkItDownWrapper:
         """
         file_type = self._get_file_type(file_path)
 
-        if file_type == "pdf":
-            return self._handle_pdf_file(file_path)
-        elif file_type == "image":
-            return self._handle_image_file(file_path)
-        elif file_type == "document":
-            return self._handle_document_file(file_path)
-        elif file_type == "spreadsheet":
-            result = self._handle_spreadsheet_file(file_path)
-            return {
-                **result,
-                "text_content": None,
-                "text": None,
-                "error_type": result.get("error_type", None),
-            }
-        elif file_type == "html":
-            result = self._handle_html_file(file_path)
-            return {
-                **result,
-                "text_content": None,
-                "text": None,
-                "error_type": result.get("error_type", None),
-            }
-        elif file_type == "json":
-            result = self._handle_json_file(file_path)
-            return {
-                **result,
-                "text_content": None,
-                "text": None,
-                "error_type": result.get("error_type", None),
-            }
-        elif file_type == "text":
-            result = self._handle_text_file(file_path)
-            return {
-                **result,
-                "text_content": None,
-                "text": None,
-                "error_type": result.get("error_type", None),
-            }
-        else:
+        # Stat once; the formatters reuse it for size and modification time
+        try:
+            st: Optional[os.stat_result] = file_path.stat()
+        except OSError:
+            st = None
+
+        # Images have their own analysis cache
+        if file_type == "image":
+            return self._handle_image_file(file_path, st=st)
+
+        cache_key = self.conversion_cache.key_for(file_path, file_type, st)
+        if cache_key is not None:
+            cached = self.conversion_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Using cached conversion for {file_path.name}")
+                return cached
+
+        result = self._convert_by_type(file_path, file_type, st=st)
+        if cache_key is not None and result.get("success"):
+            self.conversion_cache.put(cache_key, result)
+        return result
+
+    def convert_files(
+        self, file_paths: List[Path], processes: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Convert several files concurrently.
+
+        Files are converted on a thread pool shared across calls, so document
+        parsing and GPT-4o requests for different files overlap. With
+        processes, non-image files missing from the conversion cache are
+        converted in worker processes instead, so pure-Python parsers such as
+        docx and xlsx readers run on several cores; images stay on threads
+        since they mostly wait on GPT-4o.
+
+        Args:
+            file_paths: Paths to the files to convert
+            processes: Convert uncached non-image files in worker processes
+
+        Returns:
+            Conversion results in the same order as file_paths
+        """
+        if not file_paths:
+            return []
+        threads = self._thread_pool()
+        if not processes:
+            return list(threads.map(self.convert_file, file_paths))
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(file_paths)
+        futures: Dict[int, Future[Dict[str, Any]]] = {}
+        cache_keys: Dict[int, Optional[str]] = {}
+        for i, file_path in enumerate(file_paths):
+            file_type = self._get_file_type(file_path)
+            if file_type == "image":
+                futures[i] = threads.submit(self.convert_file, file_path)
+                continue
+            try:
+                st: Optional[os.stat_result] = file_path.stat()
+            except OSError:
+                st = None
+            cache_key = self.conversion_cache.key_for(file_path, file_type, st)
+            if cache_key is not None:
+                results[i] = self.conversion_cache.get(cache_key)
+                if results[i] is not None:
+                    continue
+            cache_keys[i] = cache_key
+            futures[i] = self._process_pool().submit(
+                _convert_in_worker, file_path, file_type, st
+            )
+
+        for i, future in futures.items():
+            result = future.result()
+            cache_key = cache_keys.get(i)
+            if cache_key is not None and result.get("success"):
+                self.conversion_cache.put(cache_key, result)
+            results[i] = result
+        return _all_results(results)
+
+    def _thread_pool(self) -> ThreadPoolExecutor:
+        """Thread pool for convert_files, created on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=min(CONVERT_MAX_WORKERS, os.cpu_count() or 1),
+                thread_name_prefix="convert",
+            )
+        return self._executor
+
+    def _process_pool(self) -> ProcessPoolExecutor:
+        """Worker processes for convert_files, created on first use."""
+        if self._process_executor is None:
+            self._process_executor = ProcessPoolExecutor(
+                max_workers=min(CONVERT_MAX_WORKERS, os.cpu_count() or 1),
+                mp_context=_PROCESS_CONTEXT,
+                initializer=_init_convert_worker,
+                initargs=(
+                    self.client.api_key,
+                    self.client.organization,
+                    str(self.client.base_url),
+                ),
+            )
+        return self._process_executor
+
+    async def aconvert_file(self, file_path: Path) -> Dict[str, Any]:
+        """Async counterpart of convert_file.
+
+        Images are analyzed with the async client, so many can be awaited at
+        once; other files are converted by convert_file in a worker thread.
+
+        Args:
+            file_path: Path to the file to convert
+
+        Returns:
+            Conversion result with standardized format
+        """
+        if self._get_file_type(file_path) == "image":
+            return await self._ahandle_image_file(file_path)
+        return await asyncio.to_thread(self.convert_file, file_path)
+
+    def _convert_by_type(
+        self,
+        file_path: Path,
+        file_type: str,
+        st: Optional[os.stat_result] = None,
+    ) -> Dict[str, Any]:
+        """Dispatch a non-image file to the handler for its type.
+
+        Args:
+            file_path: Path to the file to convert
+            file_type: File type from _get_file_type
+            st: Stat result for the file, if already known
+
+        Returns:
+            Conversion result with standardized format
+        """
+        handler_name = self._TYPE_HANDLERS.get(file_type)
+        if handler_name is None:
             return create_error_result(
                 f"Unsupported file type: {file_type}", "unsupported_type"
             )
+        handler = getattr(self, handler_name)
+        result: Dict[str, Any] = handler(file_path, st=st)
+        return result
 
     def _format_cannot_parse(
         self,
@@ -211,7 +855,10 @@ class MarkItDownWrapper:
     ) -> Dict[str, Any]:
         """Format message for files that cannot be parsed."""
         file_path = Path(filename)
-        file_info = file_path.stat() if file_path.exists() else None
+        try:
+            file_info: Optional[os.stat_result] = file_path.stat()
+        except OSError:
+            file_info = None
 
         # Format file size
         size_str = f"{file_info.st_size / 1024:.2f} KB" if file_info else "Unknown"
@@ -243,122 +890,191 @@ class MarkItDownWrapper:
         }
 
     @log_timing
-    def _handle_image_file(self, file_path: Path) -> Dict[str, Any]:
+    def _handle_image_file(
+        self, file_path: Path, st: Optional[os.stat_result] = None
+    ) -> Dict[str, Any]:
         """Handle image file conversion."""
-        # Check if file exists
-        if not file_path.exists():
-            return {
-                "success": False,
-                "content": None,
-                "error": f"File not found: {file_path.name}",
-                "type": "image",
-                "text_content": None,
-                "text": None,
-                "error_type": "file_not_found",
-            }
+        # Check if file exists, reusing the caller's stat when available
+        if st is None:
+            try:
+                st = file_path.stat()
+            except OSError:
+                return self._image_error(
+                    f"File not found: {file_path.name}", "file_not_found"
+                )
 
         try:
-            # Check cache first
-            if self.image_cache.is_processed(file_path):
-                with log_block_timing(f"Cache lookup for {file_path.name}"):
-                    cached_path = self.image_cache.get_cached_path(file_path)
-                    if cached_path:
-                        logger.info(f"Using cached analysis for {file_path.name}")
-                        return {
-                            "success": True,
-                            "content": self._format_image_analysis(
-                                cached_path.read_text(), file_path.name
-                            ),
-                            "type": "image",
-                            "text_content": None,
-                            "text": None,
-                            "error": None,
-                            "error_type": None,
-                        }
-
-            # Handle HEIC files first
-            if file_path.suffix.lower() in {".heic", ".heif"}:
-                with log_block_timing(f"HEIC conversion for {file_path.name}"):
-                    converted_path = self.image_converter.convert_heic(file_path)
-                    if not converted_path:
-                        return {
-                            "success": False,
-                            "content": None,
-                            "error": f"Failed to convert HEIC file: {file_path.name}",
-                            "type": "image",
-                            "text_content": None,
-                            "text": None,
-                            "error_type": "heic_conversion_error",
-                        }
-                    file_path = converted_path
-
-            # Convert image to PNG if not in supported format
-            supported_formats = {".png", ".jpg", ".jpeg", ".gif", ".webp"}
-            if file_path.suffix.lower() not in supported_formats:
-                with log_block_timing(f"PNG conversion for {file_path.name}"):
-                    png_path = self.temp_images / f"{file_path.stem}.png"
-                    if not self.image_converter.convert_to_png(file_path, png_path):
-                        return {
-                            "success": False,
-                            "content": None,
-                            "error": f"Failed to convert {file_path.suffix} to PNG",
-                            "type": "image",
-                            "text_content": None,
-                            "text": None,
-                            "error_type": "image_conversion_error",
-                        }
-                    file_path = png_path
-
-            # Process the image
+            prepared = self._prepare_image(file_path, st)
+            if isinstance(prepared, dict):
+                return prepared
+
+            # Analyze with GPT-4o
             with log_block_timing(f"GPT-4o analysis for {file_path.name}"):
-                with open(file_path, "rb") as f:
-                    image_data = f.read()
-                    base64_image = base64.b64encode(image_data).decode()
+                try:
+                    analysis = self._call_openai(self._image_messages(prepared))
+                except Exception as e:
+                    logger.error("Error analyzing image: %s", str(e))
+                    return self._image_error(
+                        f"Error analyzing image: {str(e)}", "analysis_error"
+                    )
+
+            return self._finish_image(file_path, st, analysis)
+
+        except Exception as e:
+            logger.error("Error processing image: %s", str(e))
+            return self._image_error(
+                f"Error processing image: {str(e)}", "processing_error"
+            )
+
+    async def convert_images(
+        self, image_paths: List[Path], concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """Convert several image files concurrently.
+
+        Each image goes through the same caching, conversion and formatting
+        as convert_file. Images are decoded and encoded on worker threads
+        and analyzed by up to `concurrency` GPT-4o requests in flight, with
+        a bounded queue between the two stages, so later images are prepared
+        while earlier ones wait on the API.
+
+        Args:
+            image_paths: Paths to the image files
+            concurrency: Maximum number of GPT-4o requests in flight
+
+        Returns:
+            Conversion results in the same order as image_paths
+
+        Raises:
+            ValueError: If concurrency is less than 1
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        results: List[Optional[Dict[str, Any]]] = [None] * len(image_paths)
+        queue: asyncio.Queue[Optional[Tuple[int, os.stat_result, str]]] = (
+            asyncio.Queue(maxsize=concurrency)
+        )
+        # Shared by the preparers, so each image is taken exactly once
+        pending = iter(enumerate(image_paths))
 
-                # Analyze with GPT-4o
+        async def prepare() -> None:
+            for i, image_path in pending:
+                try:
+                    st = image_path.stat()
+                except OSError:
+                    results[i] = self._image_error(
+                        f"File not found: {image_path.name}", "file_not_found"
+                    )
+                    continue
                 try:
-                    response = self.client.chat.completions.create(
-                        model="gpt-4o",
-                        messages=[
-                            {
-                                "role": "user",
-                                "content": [
-                                    {
-                                        "type": "text",
-                                        "text": "Describe this image in detail.",
-                                    },
-                                    {
-                                        "type": "image_url",
-                                        "image_url": {
-                                            "url": f"data:image/jpeg;base64,{base64_image}",
-                                            "detail": "high",
-                                        },
-                                    },
-                                ],
-                            }
-                        ],
+                    prepared = await asyncio.to_thread(
+                        self._prepare_image, image_path, st
                     )
-                    analysis = response.choices[0].message.content
                 except Exception as e:
-                    logger.error("Error analyzing image: %s", str(e))
-                    return {
-                        "success": False,
-                        "content": None,
-                        "error": f"Error analyzing image: {str(e)}",
-                        "type": "image",
-                        "text_content": None,
-                        "text": None,
-                        "error_type": "analysis_error",
-                    }
+                    logger.error("Error processing image: %s", str(e))
+                    results[i] = self._image_error(
+                        f"Error processing image: {str(e)}", "processing_error"
+                    )
+                    continue
+                if isinstance(prepared, dict):
+                    results[i] = prepared
+                else:
+                    await queue.put((i, st, prepared))
+
+        async def analyze() -> None:
+            while (item := await queue.get()) is not None:
+                i, st, image_url = item
+                results[i] = await self._aanalyze_image(image_paths[i], st, image_url)
+
+        preparers = min(os.cpu_count() or 1, concurrency)
+        analyzers = [asyncio.create_task(analyze()) for _ in range(concurrency)]
+        try:
+            await asyncio.gather(*(prepare() for _ in range(preparers)))
+            for _ in analyzers:
+                await queue.put(None)
+            await asyncio.gather(*analyzers)
+        finally:
+            for task in analyzers:
+                task.cancel()
+        return _all_results(results)
+
+    async def _ahandle_image_file(
+        self, file_path: Path, st: Optional[os.stat_result] = None
+    ) -> Dict[str, Any]:
+        """Async counterpart of _handle_image_file.
 
-            # Cache successful analysis
-            if analysis is not None:
-                with log_block_timing(f"Cache storage for {file_path.name}"):
-                    self.image_cache.cache_analysis(file_path, analysis)
+        Decoding and encoding run in a worker thread so other images can be
+        analyzed meanwhile.
+        """
+        if st is None:
+            try:
+                st = file_path.stat()
+            except OSError:
+                return self._image_error(
+                    f"File not found: {file_path.name}", "file_not_found"
+                )
 
+        try:
+            prepared = await asyncio.to_thread(self._prepare_image, file_path, st)
+            if isinstance(prepared, dict):
+                return prepared
+            return await self._aanalyze_image(file_path, st, prepared)
+
+        except Exception as e:
+            logger.error("Error processing image: %s", str(e))
+            return self._image_error(
+                f"Error processing image: {str(e)}", "processing_error"
+            )
+
+    async def _aanalyze_image(
+        self, file_path: Path, st: os.stat_result, image_url: str
+    ) -> Dict[str, Any]:
+        """Analyze a prepared image with GPT-4o and format the result.
+
+        Args:
+            file_path: Path to the original image file
+            st: Stat result for the file
+            image_url: Data or remote URL from _prepare_image
+
+        Returns:
+            Conversion result with standardized format
+        """
+        try:
+            analysis = await self._acall_openai(self._image_messages(image_url))
+        except Exception as e:
+            logger.error("Error analyzing image: %s", str(e))
+            return self._image_error(
+                f"Error analyzing image: {str(e)}", "analysis_error"
+            )
+
+        try:
+            return self._finish_image(file_path, st, analysis)
+        except Exception as e:
+            logger.error("Error processing image: %s", str(e))
+            return self._image_error(
+                f"Error processing image: {str(e)}", "processing_error"
+            )
+
+    def _prepare_image(
+        self, file_path: Path, st: os.stat_result
+    ) -> Dict[str, Any] | str:
+        """Resolve an image from the cache or encode it for analysis.
+
+        Args:
+            file_path: Path to the image file
+            st: Stat result for the file
+
+        Returns:
+            Image data URL to analyze, or a finished result when no GPT-4o
+            request is needed (a cache hit or a conversion error)
+        """
+        # Check cache first; descriptions are keyed by image content
+        with log_block_timing(f"Cache lookup for {file_path.name}"):
+            description = self.image_cache.get_description(file_path, st)
+        if description is not None:
+            logger.info(f"Using cached analysis for {file_path.name}")
             return {
                 "success": True,
-                "content": self._format_image_analysis(analysis, file_path.name),
+                "content": self._format_image_analysis(description, file_path, st),
                 "type": "image",
                 "text_content": None,
                 "text": None,
@@ -366,17 +1082,186 @@ class MarkItDownWrapper:
                 "error_type": None,
             }
 
+        image_url: Optional[str] = None
+        suffix = file_path.suffix.lower()
+
+        # Handle HEIC files first
+        if suffix in self._HEIC_EXTENSIONS and HEIF_SUPPORT:
+            with log_block_timing(f"HEIC decode for {file_path.name}"):
+                image_url = self._encode_image(file_path)
+                if image_url is None:
+                    return self._image_error(
+                        f"Failed to convert HEIC file: {file_path.name}",
+                        "heic_conversion_error",
+                    )
+        elif suffix in self._HEIC_EXTENSIONS:
+            with log_block_timing(f"HEIC conversion for {file_path.name}"):
+                converted_path = self.image_converter.convert_heic(file_path)
+                if not converted_path:
+                    return self._image_error(
+                        f"Failed to convert HEIC file: {file_path.name}",
+                        "heic_conversion_error",
+                    )
+                file_path = converted_path
+                suffix = file_path.suffix.lower()
+
+        # Render SVG to PNG in memory
+        if suffix == ".svg":
+            with log_block_timing(f"SVG render for {file_path.name}"):
+                image_url = self._render_svg(file_path)
+                if image_url is None:
+                    return self._image_error(
+                        f"Failed to convert {file_path.suffix} to PNG",
+                        "image_conversion_error",
+                    )
+
+        # Convert image to PNG if not in supported format
+        if image_url is None and suffix not in self._OAI_NATIVE_EXTENSIONS:
+            with log_block_timing(f"PNG conversion for {file_path.name}"):
+                png_path = self.temp_images / f"{file_path.stem}.png"
+                if not self.image_converter.convert_to_png(file_path, png_path):
+                    return self._image_error(
+                        f"Failed to convert {file_path.suffix} to PNG",
+                        "image_conversion_error",
+                    )
+                file_path = png_path
+
+        if image_url is None:
+            image_url = self._encode_image(file_path)
+        if image_url is None:
+            return self._image_error(
+                f"Failed to encode image: {file_path.name}", "image_conversion_error"
+            )
+        return image_url
+
+    def _finish_image(
+        self, file_path: Path, st: os.stat_result, analysis: Optional[str]
+    ) -> Dict[str, Any]:
+        """Cache a GPT-4o analysis and format the conversion result.
+
+        Args:
+            file_path: Path to the original image file
+            st: Stat result for the file
+            analysis: Analysis text from GPT-4o
+
+        Returns:
+            Conversion result with standardized format
+        """
+        # Cache successful analysis
+        if analysis is not None:
+            with log_block_timing(f"Cache storage for {file_path.name}"):
+                self.image_cache.set_description(file_path, analysis, st)
+
+        return {
+            "success": True,
+            "content": self._format_image_analysis(analysis, file_path, st),
+            "type": "image",
+            "text_content": None,
+            "text": None,
+            "error": None,
+            "error_type": None,
+        }
+
+    def _image_error(self, error_msg: str, error_type: str) -> Dict[str, Any]:
+        """Format an image conversion error result."""
+        return {
+            "success": False,
+            "content": None,
+            "error": error_msg,
+            "type": "image",
+            "text_content": None,
+            "text": None,
+            "error_type": error_type,
+        }
+
+    def _encode_image(self, file_path: Path) -> Optional[str]:
+        """Encode an image as a data URL for the vision API.
+
+        Images whose longest side exceeds MAX_IMAGE_SIDE, or non-JPEG files of
+        at least REENCODE_MIN_BYTES, are downscaled and re-encoded as JPEG, and
+        HEIC/HEIF images are decoded in memory to PNG. Anything else is sent
+        as-is.
+
+        Args:
+            file_path: Path to the image file
+
+        Returns:
+            Image data URL, or None if the image could not be encoded
+        """
+        try:
+            suffix = file_path.suffix.lower()
+            size = read_image_size(file_path)
+            reencode = size is not None and (
+                max(size) > MAX_IMAGE_SIDE
+                or (
+                    suffix not in self._JPEG_EXTENSIONS
+                    and file_path.stat().st_size >= REENCODE_MIN_BYTES
+                )
+            )
+            if not reencode and suffix not in self._HEIC_EXTENSIONS:
+                return self._image_file_url(file_path)
+
+            from PIL import Image, ImageOps
+
+            buffer = io.BytesIO()
+            with _open_image(file_path) as opened:
+                if reencode:
+                    # Downscale first so JPEGs decode at reduced size; the EXIF
+                    # orientation survives the in-place thumbnail
+                    opened.thumbnail(
+                        (MAX_IMAGE_SIDE, MAX_IMAGE_SIDE), Image.Resampling.LANCZOS
+                    )
+                # Re-encoding drops EXIF, so apply its orientation to the pixels
+                img = ImageOps.exif_transpose(opened)
+                if reencode:
+                    # Skip the optimized Huffman pass: ~4x slower for ~6% smaller
+                    _flatten_image(img).save(
+                        buffer, format="JPEG", quality=JPEG_QUALITY, optimize=False
+                    )
+                    mime_type = "image/jpeg"
+                else:
+                    # Fast, light compression: the API re-encodes the image anyway
+                    img.save(buffer, format="PNG", compress_level=1)
+                    mime_type = "image/png"
+            return self._image_url(buffer.getbuffer(), mime_type)
         except Exception as e:
-            logger.error("Error processing image: %s", str(e))
-            return {
-                "success": False,
-                "content": None,
-                "error": f"Error processing image: {str(e)}",
-                "type": "image",
-                "text_content": None,
-                "text": None,
-                "error_type": "processing_error",
-            }
+            logger.error("Failed to encode image %s: %s", file_path.name, e)
+            return None
+
+    def _render_svg(self, file_path: Path) -> Optional[str]:
+        """Render an SVG image to an opaque PNG data URL without a temporary file.
+
+        Args:
+            file_path: Path to the SVG file
+
+        Returns:
+            Image data URL, or None if the SVG could not be rendered
+        """
+        import fitz  # type: ignore
+
+        doc = None
+        pix = None
+        try:
+            svg_bytes = file_path.read_bytes()
+            with _FITZ_LOCK:
+                doc = fitz.open(stream=svg_bytes, filetype="svg")
+                page = doc.load_page(0)
+                # Native size on an opaque background, scaled down so the
+                # longest side fits MAX_IMAGE_SIDE; PNG stays smaller than JPEG
+                # for flat vector artwork
+                longest = max(page.rect.width, page.rect.height)
+                zoom = min(1.0, MAX_IMAGE_SIDE / longest) if longest else 1.0
+                pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+                png_bytes = pix.tobytes("png")
+            return self._image_url(png_bytes, "image/png")
+        except Exception as e:
+            logger.error("Failed to render SVG %s: %s", file_path.name, e)
+            return None
+        finally:
+            pix = None
+            if doc is not None:
+                with _FITZ_LOCK:
+                    doc.close()
 
     def process_markdown(self, content: str, processed_paths: Dict[str, Path]) -> str:
         """Process markdown content with processed attachment paths.
@@ -388,14 +1273,23 @@ class MarkItDownWrapper:
         Returns:
             Processed markdown content with updated references
         """
+        if not processed_paths:
+            return content
+
         try:
-            # Replace attachment references with processed paths
-            processed_content = content
+            # Replace all attachment references with processed paths in one pass,
+            # matching only references that appear in this note
+            replacements: Dict[str, str] = {}
             for original_path, processed_path in processed_paths.items():
-                processed_content = processed_content.replace(
-                    f"]({original_path})", f"]({processed_path})"
-                )
-            return processed_content
+                key = f"]({original_path})"
+                if key in content:
+                    replacements[key] = f"]({processed_path})"
+            if not replacements:
+                return content
+            # Longest keys first so overlapping paths resolve to the most specific
+            keys = sorted(replacements, key=len, reverse=True)
+            pattern = re.compile("|".join(re.escape(key) for key in keys))
+            return pattern.sub(lambda match: replacements[match.group(0)], content)
 
         except Exception as e:
             logger.error(f"Error processing markdown content: {e}")
@@ -410,7 +1304,9 @@ class MarkItDownWrapper:
         Returns:
             Dictionary containing the processing results
         """
-        if not image_path.exists():
+        try:
+            st = image_path.stat()
+        except OSError:
             logger.error(f"Image file not found: {image_path}")
             return {
                 "success": False,
@@ -418,62 +1314,398 @@ class MarkItDownWrapper:
                 "error": f"Image file not found: {image_path}",
             }
 
+        # Descriptions are cached by image content, as in convert_file
+        description = self.image_cache.get_description(image_path, st)
+        if description is not None:
+            return {"success": True, "text": description, "error": None}
+
         try:
-            # Read image file
-            with open(image_path, "rb") as f:
-                image_data = base64.b64encode(f.read()).decode("utf-8")
+            image_url = self._encode_image(image_path)
+            if image_url is None:
+                raise ValueError(f"Failed to encode image: {image_path.name}")
 
-            # Process with retries
-            for attempt in range(self.max_retries):
-                try:
-                    messages: List[ChatCompletionMessageParam] = [
-                        {
-                            "role": "user",
-                            "content": [
-                                {
-                                    "type": "text",
-                                    "text": "Describe this image in detail.",
-                                },
-                                {
-                                    "type": "image_url",
-                                    "image_url": {
-                                        "url": f"data:image/jpeg;base64,{image_data}",
-                                        "detail": "high",
-                                    },
-                                },
-                            ],
-                        }
-                    ]
-
-                    # Avoid logging base64 data
-                    logger.debug("Sending request to OpenAI API with image data")
-                    response = self.client.chat.completions.create(
-                        model="gpt-4o", messages=messages
-                    )
+            messages = self._image_messages(image_url)
+            description = self._call_openai(messages)
+            if description is not None:
+                self.image_cache.set_description(image_path, description, st)
+            return {"success": True, "text": description or "", "error": None}
 
-                    # Extract and format the response
-                    if response and response.choices and response.choices[0].message:
-                        description = response.choices[0].message.content or ""
-                        return {"success": True, "text": description, "error": None}
-                    else:
-                        raise ValueError("Invalid response from OpenAI API")
+        except Exception as e:
+            logger.error(f"Failed to process image {image_path}: {e}")
+            return {"success": False, "content": None, "error": str(e)}
 
-                except Exception as e:
-                    if attempt == self.max_retries - 1:
-                        raise
-                    logger.warning(f"Retry {attempt + 1} failed: {e}")
-                    time.sleep(self.retry_delay)
+    async def process_images(
+        self, image_paths: List[Path], max_concurrent: int = 10
+    ) -> List[Dict[str, Any]]:
+        """Process several images with GPT-4o concurrently.
+
+        Args:
+            image_paths: Paths to the image files
+            max_concurrent: Maximum number of requests in flight at once
+
+        Returns:
+            Processing results in the same order as image_paths
+
+        Raises:
+            ValueError: If max_concurrent is less than 1
+        """
+        if max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be at least 1, got {max_concurrent}")
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def process_one(image_path: Path) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._aprocess_image(image_path)
+
+        return await asyncio.gather(*(process_one(path) for path in image_paths))
+
+    async def _aprocess_image(self, image_path: Path) -> Dict[str, Any]:
+        """Async counterpart of process_image.
+
+        Args:
+            image_path: Path to the image file
 
+        Returns:
+            Dictionary containing the processing results
+        """
+        try:
+            st = image_path.stat()
+        except OSError:
+            logger.error(f"Image file not found: {image_path}")
             return {
                 "success": False,
                 "content": None,
-                "error": f"Failed to process image after {self.max_retries} attempts",
+                "error": f"Image file not found: {image_path}",
             }
 
+        description = await asyncio.to_thread(
+            self.image_cache.get_description, image_path, st
+        )
+        if description is not None:
+            return {"success": True, "text": description, "error": None}
+
+        try:
+            image_url = await asyncio.to_thread(self._encode_image, image_path)
+            if image_url is None:
+                raise ValueError(f"Failed to encode image: {image_path.name}")
+            description = await self._acall_openai(self._image_messages(image_url))
+            if description is not None:
+                self.image_cache.set_description(image_path, description, st)
+            return {"success": True, "text": description or "", "error": None}
+
         except Exception as e:
             logger.error(f"Failed to process image {image_path}: {e}")
             return {"success": False, "content": None, "error": str(e)}
 
+    def process_images_batch(
+        self, image_paths: List[Path], batch_size: int = IMAGE_BATCH_MAX
+    ) -> List[Dict[str, Any]]:
+        """Process several images with GPT-4o, describing a batch per request.
+
+        Uncached images are sent up to batch_size at a time in one request,
+        cutting the request count against a requests-per-minute limit. If a
+        batched request fails or its response cannot be split into one
+        description per image, that batch is retried one image per request.
+
+        Args:
+            image_paths: Paths to the image files
+            batch_size: Images per request, capped at IMAGE_BATCH_MAX
+
+        Returns:
+            Processing results in the same order as image_paths, in the
+            format returned by process_image
+        """
+        batch_size = max(1, min(batch_size, IMAGE_BATCH_MAX))
+        results: List[Optional[Dict[str, Any]]] = [None] * len(image_paths)
+        uncached: List[Tuple[int, os.stat_result]] = []
+        for i, image_path in enumerate(image_paths):
+            try:
+                st = image_path.stat()
+            except OSError:
+                logger.error(f"Image file not found: {image_path}")
+                results[i] = {
+                    "success": False,
+                    "content": None,
+                    "error": f"Image file not found: {image_path}",
+                }
+                continue
+            description = self.image_cache.get_description(image_path, st)
+            if description is not None:
+                results[i] = {"success": True, "text": description, "error": None}
+            else:
+                uncached.append((i, st))
+
+        for start in range(0, len(uncached), batch_size):
+            # Encode one batch at a time so only its images are held in memory
+            batch: List[Tuple[int, os.stat_result, str]] = []
+            for i, st in uncached[start : start + batch_size]:
+                image_url = self._encode_image(image_paths[i])
+                if image_url is None:
+                    results[i] = {
+                        "success": False,
+                        "content": None,
+                        "error": f"Failed to encode image: {image_paths[i].name}",
+                    }
+                else:
+                    batch.append((i, st, image_url))
+
+            descriptions: Optional[List[str]] = None
+            if len(batch) > 1:
+                try:
+                    content = self._call_openai(
+                        self._batch_image_messages([url for _, _, url in batch]),
+                        tokens=VISION_REQUEST_TOKENS * len(batch),
+                    )
+                    descriptions = _split_batch_response(content or "", len(batch))
+                except Exception as e:
+                    logger.warning(f"Batched image request failed: {e}")
+                if descriptions is None:
+                    logger.warning("Describing batch one image per request instead")
+
+            for j, (i, st, image_url) in enumerate(batch):
+                try:
+                    if descriptions is not None:
+                        description = descriptions[j]
+                    else:
+                        description = self._call_openai(self._image_messages(image_url))
+                except Exception as e:
+                    logger.error(f"Failed to process image {image_paths[i]}: {e}")
+                    results[i] = {"success": False, "content": None, "error": str(e)}
+                    continue
+                if description is not None:
+                    self.image_cache.set_description(image_paths[i], description, st)
+                results[i] = {"success": True, "text": description or "", "error": None}
+
+        return _all_results(results)
+
+    def _image_file_url(self, image_path: Path) -> str:
+        """Build the image URL for the bytes on disk, labelled with their MIME type.
+
+        Args:
+            image_path: Path to the image file
+
+        Returns:
+            Image data or remote URL
+        """
+        mime_type = mimetypes.guess_type(image_path.name)[0] or "image/jpeg"
+        with open(image_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size <= MMAP_MIN_BYTES:
+                return self._image_url(f.read(), mime_type)
+            # Encode straight from the mapped file instead of a bytes copy
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return self._image_url(mm, mime_type)
+
+    def _image_url(self, data: Any, mime_type: str) -> str:
+        """Build the URL GPT-4o reads an encoded image from.
+
+        With an upload URL configured the image is uploaded and referenced by
+        URL, which keeps the base64 payload (a third larger than the image)
+        out of every request and retry. Otherwise, or if the upload fails,
+        the image is inlined as a data URL.
+
+        Args:
+            data: Encoded image bytes, as any bytes-like object
+            mime_type: MIME type of the image data
+
+        Returns:
+            Image data or remote URL
+        """
+        if self.image_upload_url is not None:
+            try:
+                return self._upload_image(self.image_upload_url, data, mime_type)
+            except OSError as e:
+                logger.warning("Image upload failed, sending inline: %s", e)
+        image_data = base64.b64encode(data).decode("ascii")
+        return f"data:{mime_type};base64,{image_data}"
+
+    def _upload_image(self, base_url: str, data: Any, mime_type: str) -> str:
+        """PUT an image under base_url at a name derived from its content.
+
+        Args:
+            base_url: Base URL to upload to
+            data: Encoded image bytes, as any bytes-like object
+            mime_type: MIME type of the image data
+
+        Returns:
+            URL of the uploaded image
+
+        Raises:
+            OSError: If the upload fails
+        """
+        name = hashlib.blake2b(data, digest_size=16).hexdigest()
+        extension = mimetypes.guess_extension(mime_type) or ""
+        url = f"{base_url.rstrip('/')}/{name}{extension}"
+        # urllib sends file-like data such as an mmap chunked, without the
+        # Content-Length that presigned PUT URLs require
+        with memoryview(data) as body:
+            request = urllib.request.Request(
+                url,
+                data=body,
+                method="PUT",
+                headers={"Content-Type": mime_type, "Content-Length": str(body.nbytes)},
+            )
+            with urllib.request.urlopen(request, timeout=IMAGE_UPLOAD_TIMEOUT):
+                pass
+        return url
+
+    def _image_messages(self, image_url: str) -> List[ChatCompletionMessageParam]:
+        """Build the chat messages asking GPT-4o to describe an image.
+
+        Args:
+            image_url: Data or remote URL of the image
+
+        Returns:
+            Chat completion messages
+        """
+        return [
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": "Describe this image in detail.",
+                    },
+                    {
+                        "type": "image_url",
+                        "image_url": {"url": image_url, "detail": "high"},
+                    },
+                ],
+            }
+        ]
+
+    def _batch_image_messages(
+        self, image_urls: List[str]
+    ) -> List[ChatCompletionMessageParam]:
+        """Build the chat messages asking GPT-4o to describe several images.
+
+        Args:
+            image_urls: Data or remote URLs of the images, in order
+
+        Returns:
+            Chat completion messages
+        """
+        prompt = (
+            f"Describe each of the following {len(image_urls)} images in detail. "
+            "Start the description of image N with a line containing only "
+            "'=== IMAGE N ===', numbering the images from 1 in the order given."
+        )
+        content: List[Any] = [{"type": "text", "text": prompt}]
+        content.extend(
+            {"type": "image_url", "image_url": {"url": url, "detail": "high"}}
+            for url in image_urls
+        )
+        return [{"role": "user", "content": content}]
+
+    def _call_openai(
+        self,
+        messages: List[ChatCompletionMessageParam],
+        tokens: int = VISION_REQUEST_TOKENS,
+    ) -> Optional[str]:
+        """Send a GPT-4o chat request, retrying transient API errors.
+
+        Requests wait for the rate limiter first. Retries honour Retry-After on
+        rate limits, which also slow the limiter down, and otherwise use
+        exponential backoff with jitter, capped at max_retry_delay.
+
+        Args:
+            messages: Chat completion messages
+            tokens: Tokens the request is expected to count against the limit
+
+        Returns:
+            Content of the first response message
+
+        Raises:
+            ValueError: If the API returns no message
+        """
+        for attempt in range(self.max_retries):
+            try:
+                time.sleep(self.rate_limiter.reserve(tokens))
+                # Avoid logging base64 data
+                logger.debug("Sending request to OpenAI API with image data")
+                response = self.client.chat.completions.create(
+                    model=VISION_MODEL, messages=messages
+                )
+                break
+            except RETRYABLE_OPENAI_ERRORS as e:
+                if attempt == self.max_retries - 1:
+                    raise
+                logger.warning(f"Retry {attempt + 1} failed: {e}")
+                if isinstance(e, RateLimitError):
+                    self.rate_limiter.slow_down()
+                time.sleep(self._backoff_delay(attempt, e))
+
+        return self._response_content(response)
+
+    async def _acall_openai(
+        self, messages: List[ChatCompletionMessageParam]
+    ) -> Optional[str]:
+        """Async counterpart of _call_openai, using the async client.
+
+        Args:
+            messages: Chat completion messages
+
+        Returns:
+            Content of the first response message
+
+        Raises:
+            ValueError: If the API returns no message
+        """
+        for attempt in range(self.max_retries):
+            try:
+                await asyncio.sleep(self.rate_limiter.reserve(VISION_REQUEST_TOKENS))
+                logger.debug("Sending async request to OpenAI API with image data")
+                response = await self.aclient.chat.completions.create(
+                    model=VISION_MODEL, messages=messages
+                )
+                break
+            except RETRYABLE_OPENAI_ERRORS as e:
+                if attempt == self.max_retries - 1:
+                    raise
+                logger.warning(f"Retry {attempt + 1} failed: {e}")
+                if isinstance(e, RateLimitError):
+                    self.rate_limiter.slow_down()
+                await asyncio.sleep(self._backoff_delay(attempt, e))
+
+        return self._response_content(response)
+
+    def _backoff_delay(self, attempt: int, error: Exception) -> float:
+        """Delay before retrying a failed attempt, capped at max_retry_delay.
+
+        Rate limit responses that say when to retry are honoured; otherwise
+        exponential backoff with jitter is used.
+
+        Args:
+            attempt: Zero-based index of the failed attempt
+            error: Exception raised by the attempt
+
+        Returns:
+            Delay in seconds
+        """
+        # 2**attempt is typed Any, since a negative exponent gives a float
+        delay: float = self.retry_delay * 2**attempt + random.uniform(
+            0, self.retry_delay
+        )
+        if isinstance(error, RateLimitError):
+            headers = error.response.headers
+            try:
+                if "retry-after-ms" in headers:
+                    delay = float(cast(str, headers["retry-after-ms"])) / 1000
+                elif "retry-after" in headers:
+                    delay = float(cast(str, headers["retry-after"]))
+            except ValueError:
+                pass  # HTTP-date or malformed header: keep the backoff delay
+        return min(delay, self.max_retry_delay)
+
+    def _response_content(self, response: ChatCompletion) -> Optional[str]:
+        """Extract the first message's content from a chat completion.
+
+        Raises:
+            ValueError: If the API returns no message
+        """
+        if response and response.choices and response.choices[0].message:
+            return response.choices[0].message.content
+        raise ValueError("Invalid response from OpenAI API")
+
     def _get_file_emoji(self, file_type: str) -> str:
         """Get emoji for file type.
 
@@ -483,17 +1715,7 @@ class MarkItDownWrapper:
         Returns:
             Emoji string for the file type
         """
-        emoji_map = {
-            "document": "📄",
-            "spreadsheet": "📊",
-            "image": "🖼️",
-            "code": "",
-            "pdf": "📑",
-            "text": "📝",
-            "html": "🌐",
-            "json": "📋",
-        }
-        return emoji_map.get(file_type, "📄")
+        return FILE_TYPE_EMOJIS.get(file_type, "📄")
 
     def _get_file_type(self, file_path: Path) -> str:
         """Determine file type from extension.
@@ -504,100 +1726,96 @@ class MarkItDownWrapper:
         Returns:
             File type string
         """
-        ext = file_path.suffix.lower()
-        if ext in {".jpg", ".jpeg", ".png", ".gif", ".webp", ".heic", ".heif", ".svg"}:
-            return "image"
-        elif ext in {".xlsx", ".csv"}:
-            return "spreadsheet"
-        elif ext in {".docx", ".doc", ".rtf"}:
-            return "document"
-        elif ext == ".pdf":
-            return "pdf"
-        elif ext == ".html":
-            return "html"
-        elif ext == ".json":
-            return "json"
-        elif ext == ".txt":
-            return "text"
-        elif ext in {".py", ".js", ".java", ".cpp"}:
-            return "code"
-        return "document"
-
-    def _format_file_content(self, content: str, filename: str) -> str:
+        return EXTENSION_FILE_TYPES.get(file_path.suffix.lower(), "document")
+
+    def _format_file_content(
+        self,
+        content: str,
+        file_path: Path,
+        st: Optional[os.stat_result] = None,
+    ) -> str:
         """Format file content with improved readability.
 
         Args:
             content: Raw content to format
-            filename: Name of the file
+            file_path: Path to the file
+            st: Stat result for the file, if already known
 
         Returns:
             Formatted content string
         """
-        file_path = Path(filename)
         file_type = self._get_file_type(file_path)
         emoji = self._get_file_emoji(file_type)
 
         # Get file metadata
-        file_size = os.path.getsize(file_path) if os.path.exists(file_path) else 0
-        size_str = f"{file_size/1024:.1f}KB" if file_size > 0 else "unknown size"
-        mod_time = (
-            time.strftime("%b %d", time.localtime(os.path.getmtime(file_path)))
-            if os.path.exists(file_path)
-            else ""
+        size_str, mod_time = self._get_file_metadata(file_path, st)
+
+        return self._DETAILS_TEMPLATE.format_map(
+            {
+                "emoji": emoji,
+                "filename": file_path.name,
+                "size": size_str,
+                "mtime": mod_time,
+                "content": content,
+            }
         )
 
-        # Format the content
-        formatted = f"""<!-- BEGIN EMBEDDED CONTENT -->
-<details class="embedded-content">
-<summary>{emoji} {filename} ({size_str}, modified {mod_time})</summary>
-
-{content}
-
-</details>
-<!-- END EMBEDDED CONTENT -->"""
-        return formatted
-
-    def _format_image_analysis(self, analysis: Optional[str], filename: str) -> str:
+    def _format_image_analysis(
+        self,
+        analysis: Optional[str],
+        file_path: Path,
+        st: Optional[os.stat_result] = None,
+    ) -> str:
         """Format image analysis with improved readability.
 
         Args:
             analysis: Image analysis text (can be None)
-            filename: Name of the image file
+            file_path: Path to the image file
+            st: Stat result for the file, if already known
 
         Returns:
             Formatted analysis string
         """
-        file_path = Path(filename)
-
         # Get image dimensions if possible
         dimensions = self._get_dimensions(file_path)
 
         # Get file metadata
-        file_size = os.path.getsize(file_path) if os.path.exists(file_path) else 0
-        size_str = f"{file_size/1024:.1f}KB" if file_size > 0 else "unknown size"
-        mod_time = (
-            time.strftime("%b %d", time.localtime(os.path.getmtime(file_path)))
-            if os.path.exists(file_path)
-            else ""
+        size_str, mod_time = self._get_file_metadata(file_path, st)
+
+        return self._DETAILS_TEMPLATE.format_map(
+            {
+                "emoji": "🖼️",
+                "filename": file_path.name,
+                "size": f"{dimensions}{size_str}",
+                "mtime": mod_time,
+                "content": analysis or "No analysis available",
+            }
         )
 
-        formatted = f"""<!-- BEGIN EMBEDDED CONTENT -->
-<details class="embedded-content">
-<summary>🖼️ {filename} ({dimensions}{size_str}, modified {mod_time})</summary>
+    def _get_file_metadata(
+        self, file_path: Path, st: Optional[os.stat_result] = None
+    ) -> Tuple[str, str]:
+        """Get display size and modification date, statting at most once.
 
-{analysis or "No analysis available"}
+        Args:
+            file_path: Path to the file
+            st: Stat result for the file, if already known
 
-</details>
-<!-- END EMBEDDED CONTENT -->"""
-        return formatted
+        Returns:
+            Tuple of (size string, modification date string)
+        """
+        if st is None:
+            try:
+                st = file_path.stat()
+            except OSError:
+                return "unknown size", ""
+        size_str = f"{st.st_size/1024:.1f}KB" if st.st_size > 0 else "unknown size"
+        return size_str, time.strftime("%b %d", time.localtime(st.st_mtime))
 
     def _get_dimensions(self, file_path: Path) -> str:
         """Get image dimensions if possible."""
-        try:
-            with Image.open(file_path) as img:
-                return f"{img.width}x{img.height}, "
-        except Exception:  # Catch specific exceptions instead of bare except
-            return ""
+        size = read_image_size(file_path)
+        return f"{size[0]}x{size[1]}, " if size else ""
 
     def _format_error(self, error_type: str, error_msg: str) -> Dict[str, Any]:
         """Format error message."""
@@ -613,63 +1831,108 @@ class MarkItDownWrapper:
 
     def cleanup(self) -> None:
         """Clean up resources."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if self._process_executor is not None:
+            self._process_executor.shutdown()
+            self._process_executor = None
         self.image_cache.cleanup()
+        self.conversion_cache.close()
+        # temp_dir also holds temp_images and the image converter's output
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
         self.image_converter.cleanup()
-        try:
-            if self.temp_images.exists():
-                for file in self.temp_images.iterdir():
-                    try:
-                        file.unlink()
-                    except Exception as e:
-                        logger.debug(f"Error deleting file {file}: {e}")
-                self.temp_images.rmdir()
-            if self.temp_dir.exists():
-                self.temp_dir.rmdir()
-        except Exception as e:
-            logger.debug(f"Error cleaning up temporary directory: {e}")
 
-    def __del__(self) -> None:
-        """Clean up on deletion."""
+    def __enter__(self) -> "MarkItDownWrapper":
+        """Context manager entry."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type],
+        exc_val: Optional[Exception],
+        exc_tb: Optional[Any],
+    ) -> None:
+        """Clean up temporary files on exit."""
         self.cleanup()
 
-    def _handle_spreadsheet_file(self, file_path: Path) -> Dict[str, Any]:
+    async def aclose(self) -> None:
+        """Close the async client if the wrapper created it, then clean up.
+
+        Its connection pool is bound to the event loop it was used on, so it
+        is closed here rather than in cleanup, and only if that is this loop.
+        """
+        if self._async_client_loop is not None:
+            if self._async_client is not None and (
+                self._async_client_loop is asyncio.get_running_loop()
+            ):
+                await self._async_client.close()
+            self._async_client = None
+            self._async_client_loop = None
+        self.cleanup()
+
+    async def __aenter__(self) -> "MarkItDownWrapper":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type],
+        exc_val: Optional[Exception],
+        exc_tb: Optional[Any],
+    ) -> None:
+        """Close the owned async client and clean up temporary files on exit."""
+        await self.aclose()
+
+    def _read_text(self, file_path: Path) -> str:
+        """Read a text file once and decode it with the first matching encoding.
+
+        Args:
+            file_path: Path to the text file
+
+        Returns:
+            Decoded file content
+        """
+        raw = file_path.read_bytes()
+        for encoding in TEXT_ENCODINGS:
+            try:
+                # Decode in text mode so \r\n and \r become \n, as open() does
+                with io.TextIOWrapper(io.BytesIO(raw), encoding=encoding) as f:
+                    return f.read()
+            except UnicodeDecodeError:
+                continue
+        return raw.decode("utf-8", errors="replace")
+
+    def _handle_spreadsheet_file(
+        self, file_path: Path, st: Optional[os.stat_result] = None
+    ) -> Dict[str, Any]:
         """Handle spreadsheet file conversion.
 
         Args:
             file_path: Path to the spreadsheet file
+            st: Stat result for the file, if already known
 
         Returns:
             Dictionary containing the conversion results
         """
+        import pandas as pd
+
         try:
             logger.info("Reading spreadsheet file: %s", file_path.name)
-            # Try different encodings
-            encodings = ["utf-8", "latin1", "cp1252"]
-            df = None
-            last_error: Optional[Union[UnicodeDecodeError, Exception]] = None
-
-            if file_path.suffix.lower() == ".csv":
-                for encoding in encodings:
-                    try:
-                        df = pd.read_csv(file_path, encoding=encoding)
-                        break
-                    except UnicodeDecodeError as e:
-                        last_error = e
-                        continue
-                    except UnicodeError as e:  # More specific than Exception
-                        last_error = e
-                        break
-
-                if df is None:
-                    error_msg = "Failed to read CSV with any encoding"
-                    raise last_error or Exception(error_msg)
-            else:  # Excel files
-                df = pd.read_excel(file_path)
-
-            # Convert to markdown table
-            md_table = df.to_markdown(index=False)
-            formatted_content = (
-                f"### File Content: {file_path.name}\n\n" f"{md_table}\n"
+            if file_path.suffix.lower() != ".csv":  # Excel files
+                df = pd.read_excel(file_path, engine=EXCEL_ENGINE)
+                md_table = df.to_markdown(index=False)
+            elif (st or file_path.stat()).st_size > LARGE_SPREADSHEET_BYTES:
+                chunks = pd.read_csv(
+                    io.StringIO(self._read_text(file_path)),
+                    chunksize=SPREADSHEET_CHUNK_ROWS,
+                )
+                md_table = self._chunks_to_markdown(chunks)
+            else:
+                df = self._read_csv(self._read_text(file_path))
+                md_table = df.to_markdown(index=False)
+            formatted_content = self._FILE_CONTENT_TEMPLATE.format(
+                filename=file_path.name, content=md_table
             )
 
             return {
@@ -688,26 +1951,74 @@ class MarkItDownWrapper:
                 f"Failed to read spreadsheet {file_path.name}: {str(e)}",
             )
 
-    def _handle_html_file(self, file_path: Path) -> Dict[str, Any]:
+    def _read_csv(self, text: str) -> Any:
+        """Parse CSV text into a DataFrame the way pandas' C engine does.
+
+        pyarrow is tried first when installed. Its result is discarded in
+        favour of the C engine when it rejects short rows, when it would
+        drop the ".1" suffix pandas gives duplicate headers, or when the
+        text holds integers too long for it to keep exact.
+
+        Args:
+            text: CSV text
+
+        Returns:
+            Parsed DataFrame
+        """
+        import pandas as pd
+
+        if CSV_ENGINE == "pyarrow" and not CSV_LONG_DIGITS_RE.search(text):
+            try:
+                df = pd.read_csv(io.StringIO(text), engine="pyarrow")
+            except ValueError as e:  # pandas' ParserError subclasses it
+                logger.debug("Falling back to the C CSV engine: %s", e)
+            else:
+                if not df.columns.has_duplicates:
+                    return df
+        return pd.read_csv(io.StringIO(text))
+
+    def _chunks_to_markdown(self, chunks: Iterable[Any]) -> str:
+        """Render DataFrame chunks as a single markdown table.
+
+        Only the first chunk gets a header row; the separator line tabulate
+        emits for the remaining chunks is dropped.
+
+        Args:
+            chunks: DataFrames sharing the same columns
+
+        Returns:
+            Markdown table
+        """
+        parts = []
+        for i, chunk in enumerate(chunks):
+            if i == 0:
+                parts.append(chunk.to_markdown(index=False))
+            else:
+                rows = chunk.to_markdown(index=False, headers=())
+                parts.append(rows.partition("\n")[2])
+        return "\n".join(part for part in parts if part)
+
+    def _handle_html_file(
+        self, file_path: Path, st: Optional[os.stat_result] = None
+    ) -> Dict[str, Any]:
         """Handle HTML file conversion.
 
         Args:
             file_path: Path to the HTML file
+            st: Unused; accepted so all file handlers share a signature
 
         Returns:
             Dictionary containing the conversion results
         """
         try:
             logger.info("Reading HTML file: %s", file_path.name)
-            with open(file_path, "r", encoding="utf-8") as f:
-                html_content = f.read()
+            html_content = file_path.read_text(encoding="utf-8")
 
             # Parse HTML and extract text
-            soup = BeautifulSoup(html_content, "html.parser")
-            text_content = soup.get_text(separator="\n\n")
+            text_content = self._extract_html_text(html_content)
 
-            formatted_content = (
-                f"### File Content: {file_path.name}\n\n" f"{text_content}\n"
+            formatted_content = self._FILE_CONTENT_TEMPLATE.format(
+                filename=file_path.name, content=text_content
             )
 
             return {
@@ -725,30 +2036,97 @@ class MarkItDownWrapper:
                 "html_error", f"Failed to read HTML {file_path.name}: {str(e)}"
             )
 
-    def _handle_json_file(self, file_path: Path) -> Dict[str, Any]:
+    def _extract_html_text(self, html_content: str) -> str:
+        """Extract the visible text from an HTML document.
+
+        Prefers selectolax's lexbor backend, then lxml, falling back to
+        BeautifulSoup's pure-Python parser when neither is installed or the
+        faster parser rejects the markup. All three return the document
+        title and body text, without the HTML_SKIPPED_TAGS elements.
+
+        Args:
+            html_content: Raw HTML markup
+
+        Returns:
+            Text content with blocks separated by blank lines
+        """
+        try:
+            if SELECTOLAX_SUPPORT:
+                from selectolax.lexbor import LexborHTMLParser  # type: ignore
+
+                tree = LexborHTMLParser(html_content)
+                tree.strip_tags(list(HTML_SKIPPED_TAGS))
+                root = tree.root
+                return root.text(separator="\n\n") if root is not None else ""
+
+            if LXML_SUPPORT:
+                from lxml import html as lxml_html  # type: ignore
+
+                root = lxml_html.document_fromstring(html_content)
+                for element in list(root.iter(*HTML_SKIPPED_TAGS)):
+                    element.drop_tree()
+                return "\n\n".join(root.itertext())
+        except Exception as e:
+            logger.debug("Falling back to html.parser: %s", e)
+
+        from bs4 import BeautifulSoup, SoupStrainer
+
+        # Only build the title and body; html.parser does not synthesize a
+        # body for fragments, so those are parsed whole
+        strainer = (
+            SoupStrainer(["title", "body"])
+            if HTML_BODY_RE.search(html_content)
+            else None
+        )
+        soup = BeautifulSoup(html_content, "html.parser", parse_only=strainer)
+        for element in soup(HTML_SKIPPED_TAGS):
+            element.decompose()
+        return soup.get_text(separator="\n\n")
+
+    def _handle_json_file(
+        self, file_path: Path, st: Optional[os.stat_result] = None
+    ) -> Dict[str, Any]:
         """Handle JSON file conversion.
 
         Args:
             file_path: Path to the JSON file
+            st: Stat result for the file, if already known
 
         Returns:
             Processed JSON content
         """
         try:
-            with open(file_path, "r") as f:
-                data = json.load(f)
+            raw = file_path.read_bytes()
+            use_orjson = ORJSON_SUPPORT and not ORJSON_MAX_DIGITS_RE.search(raw)
+            if use_orjson:
+                try:
+                    data = orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    # NaN and Infinity are accepted by the json module only
+                    use_orjson = False
+            if not use_orjson:
+                data = json.loads(raw)
+
+            if len(raw) > LARGE_JSON_BYTES:
+                # Skip re-serializing very large documents
+                formatted_json = raw.decode("utf-8", errors="replace")
+            elif use_orjson:
                 # Pretty print the JSON with proper indentation
+                formatted_json = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+            else:
                 formatted_json = json.dumps(data, indent=2)
-                content = f"```json\n{formatted_json}\n```"
-                return {
-                    "success": True,
-                    "content": self._format_file_content(content, file_path.name),
-                    "type": "json",
-                    "text_content": None,
-                    "text": None,
-                    "error": None,
-                    "error_type": None,
-                }
+
+            content = f"```json\n{formatted_json}\n```"
+            return {
+                "success": True,
+                "content": self._format_file_content(content, file_path, st),
+                "type": "json",
+                "text_content": None,
+                "text": None,
+                "error": None,
+                "error_type": None,
+            }
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
         except json.JSONDecodeError as e:
             return self._format_error(
                 "json_parse_error", f"Invalid JSON file: {str(e)}"
@@ -758,11 +2136,14 @@ class MarkItDownWrapper:
                 "file_error", f"Error reading JSON file: {str(e)}"
             )
 
-    def _handle_document_file(self, file_path: Path) -> Dict[str, Any]:
+    def _handle_document_file(
+        self, file_path: Path, st: Optional[os.stat_result] = None
+    ) -> Dict[str, Any]:
         """Handle document file conversion.
 
         Args:
             file_path: Path to the document file
+            st: Stat result for the file, if already known
 
         Returns:
             Dictionary containing the conversion results
@@ -772,7 +2153,7 @@ class MarkItDownWrapper:
             result = self.markitdown.convert_document(str(file_path))
             return {
                 "success": True,
-                "content": self._format_file_content(result, file_path.name),
+                "content": self._format_file_content(result, file_path, st),
                 "type": "document",
                 "text_content": None,
                 "text": None,
@@ -785,43 +2166,26 @@ class MarkItDownWrapper:
                 "document_error", f"Failed to read document {file_path.name}: {str(e)}"
             )
 
-    def _handle_text_file(self, file_path: Path) -> Dict[str, Any]:
+    def _handle_text_file(
+        self, file_path: Path, st: Optional[os.stat_result] = None
+    ) -> Dict[str, Any]:
         """Handle text file conversion.
 
         Args:
             file_path: Path to the text file
+            st: Stat result for the file, if already known
 
         Returns:
             Dictionary containing the conversion results
         """
         try:
-            # Try different encodings
-            encodings = ["utf-8", "latin1", "cp1252"]
-            content = None
-            last_error = None
-
-            for encoding in encodings:
-                try:
-                    with open(file_path, "r", encoding=encoding) as f:
-                        content = f.read()
-                        break
-                except UnicodeDecodeError as e:
-                    last_error = e
-                    continue
-                except Exception as e:
-                    last_error = e
-                    break
-
-            if content is None:
-                raise last_error or Exception(
-                    "Failed to read text file with any encoding"
-                )
+            content = self._read_text(file_path)
 
             # Format as markdown code block
             formatted_content = f"```\n{content}\n```"
             return {
                 "success": True,
-                "content": self._format_file_content(formatted_content, file_path.name),
+                "content": self._format_file_content(formatted_content, file_path, st),
                 "type": "text",
                 "text_content": None,
                 "text": None,
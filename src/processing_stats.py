@@ -1,5 +1,6 @@
 """Module for tracking processing statistics."""
 
+from collections import Counter
 from typing import List, Dict, Tuple, Optional, Set
 from dataclasses import dataclass, field
 from enum import Enum, auto
@@ -19,54 +20,82 @@ class ErrorType(Enum):
 class ProcessingStats:
     """Class to track processing statistics."""
 
+    __slots__ = (
+        "total_files",
+        "total_attachments",
+        "successful_attachments",
+        "skipped_attachments",
+        "external_urls",
+        "images_skipped",
+        "error_types",
+        "skipped_files",
+        "processed_files",
+        "unchanged_files",
+        "file_errors",
+        "attachment_errors",
+    )
+
+    # Summary table rules
+    _RULE = "─" * 53 + "\n"
+    _TOP_RULE = "─" * 20 + "┬" + "─" * 32 + "\n"
+    _MID_RULE = "─" * 20 + "┼" + "─" * 32 + "\n"
+
     def __init__(self) -> None:
         """Initialize processing statistics."""
         self.total_files = 0
-        self.files_processed = 0
-        self.files_skipped = 0
-        self.files_unchanged = 0
-        self.files_with_errors = 0
         self.total_attachments = 0
         self.successful_attachments = 0
         self.skipped_attachments = 0
         self.external_urls = 0
         self.images_skipped = 0
-        self.error_types: Dict[ErrorType, int] = {}
+        self.error_types: Counter[ErrorType] = Counter()
+        # Files are counted once each; the counts are the sizes of these
         self.skipped_files: Set[str] = set()
         self.processed_files: Set[str] = set()
-        self.error_files: Set[str] = set()
         self.unchanged_files: Set[str] = set()
         self.file_errors: Dict[str, str] = {}  # file_path -> error_message
         self.attachment_errors: Dict[str, Tuple[str, ErrorType]] = {}  # file_path -> (error_message, error_type)
 
+    @property
+    def files_processed(self) -> int:
+        """Number of distinct files processed."""
+        return len(self.processed_files)
+
+    @property
+    def files_skipped(self) -> int:
+        """Number of distinct files skipped."""
+        return len(self.skipped_files)
+
+    @property
+    def files_unchanged(self) -> int:
+        """Number of distinct files left unchanged."""
+        return len(self.unchanged_files)
+
+    @property
+    def files_with_errors(self) -> int:
+        """Number of distinct files with errors."""
+        return len(self.file_errors)
+
     def record_total(self, total: int) -> None:
         """Record total number of files found."""
         self.total_files = total
 
     def record_processed(self, file_path: str) -> None:
         """Record a file as processed."""
-        if file_path not in self.processed_files:
-            self.processed_files.add(file_path)
-            self.files_processed += 1
+        self.processed_files.add(file_path)
 
     def record_skipped(self, file_path: str) -> None:
         """Record a file as skipped."""
-        if file_path not in self.skipped_files:
-            self.skipped_files.add(file_path)
-            self.files_skipped += 1
+        self.skipped_files.add(file_path)
 
     def record_unchanged(self, file_path: str) -> None:
         """Record a file as unchanged."""
-        if file_path not in self.unchanged_files:
-            self.unchanged_files.add(file_path)
-            self.files_unchanged += 1
+        self.unchanged_files.add(file_path)
 
     def record_error(self, file_path: str, error: str) -> None:
         """Record a file as having an error."""
-        if file_path not in self.error_files:
-            self.error_files.add(file_path)
-            self.files_with_errors += 1
-            self.file_errors[file_path] = error
+        # Keep the first error reported for a file
+        self.file_errors.setdefault(file_path, error)
 
     def record_attachment_success(self) -> None:
         """Record a successful attachment processing."""
@@ -77,7 +106,7 @@ class ProcessingStats:
         """Record an attachment processing error."""
         self.total_attachments += 1
         if error_type:
-            self.error_types[error_type] = self.error_types.get(error_type, 0) + 1
+            self.error_types[error_type] += 1
         if file_path and error_msg:
             self.attachment_errors[file_path] = (error_msg, error_type or ErrorType.GENERAL)
 
@@ -86,7 +115,7 @@ class ProcessingStats:
         self.total_attachments += 1
         self.skipped_attachments += 1
         if error_type:
-            self.error_types[error_type] = self.error_types.get(error_type, 0) + 1
+            self.error_types[error_type] += 1
 
     def record_external_url(self) -> None:
         """Record an external URL."""
@@ -101,37 +130,44 @@ class ProcessingStats:
 
     def _format_summary(self) -> str:
         """Format the processing summary."""
-        summary = ""
-        summary += "─" * 53 + "\n"
-        summary += " " * 16 + "Processing Summary\n"
-        summary += "─" * 20 + "┬" + "─" * 32 + "\n"
-        summary += " Files              │ Attachments\n"
-        summary += "─" * 20 + "┼" + "─" * 32 + "\n"
-        summary += f" Total: {self.total_files:<11} │ Total: {self.total_attachments}\n"
-        summary += f" Processed: {self.files_processed:<7} │ Processed: {self.successful_attachments}\n"
-        summary += f" Errors: {self.files_with_errors:<10} │ Errors: {sum(self.error_types.values())}\n"
-        summary += f" Skipped: {self.files_skipped:<9} │ Skipped: {self.skipped_attachments}\n"
-        summary += f" Unchanged: {self.files_unchanged:<8} │ External URLs: {self.external_urls}\n"
+        parts = [
+            self._RULE,
+            " " * 16 + "Processing Summary\n",
+            self._TOP_RULE,
+            " Files              │ Attachments\n",
+            self._MID_RULE,
+            f" Total: {self.total_files:<11} │ Total: {self.total_attachments}\n",
+            f" Processed: {self.files_processed:<7} │ Processed: {self.successful_attachments}\n",
+            f" Errors: {self.files_with_errors:<10} │ Errors: {sum(self.error_types.values())}\n",
+            f" Skipped: {self.files_skipped:<9} │ Skipped: {self.skipped_attachments}\n",
+            f" Unchanged: {self.files_unchanged:<8} │ External URLs: {self.external_urls}\n",
+        ]
         if self.images_skipped > 0:
-            summary += f" Images Skipped: {self.images_skipped:<5} │ (--no_image flag)\n"
-        summary += "─" * 53 + "\n"
+            parts.append(f" Images Skipped: {self.images_skipped:<5} │ (--no_image flag)\n")
+        parts.append(self._RULE)
 
         if self.file_errors:
-            summary += "\nFile Errors:\n"
-            for file_path, error in self.file_errors.items():
-                summary += f"  {file_path}: {error}\n"
+            parts.append("\nFile Errors:\n")
+            parts.extend(
+                f"  {file_path}: {error}\n"
+                for file_path, error in self.file_errors.items()
+            )
 
         if self.attachment_errors:
-            summary += "\nAttachment Errors:\n"
-            for file_path, (error_msg, error_type) in self.attachment_errors.items():
-                summary += f"  {file_path}: {error_type.name} - {error_msg}\n"
+            parts.append("\nAttachment Errors:\n")
+            parts.extend(
+                f"  {file_path}: {error_type.name} - {error_msg}\n"
+                for file_path, (error_msg, error_type) in self.attachment_errors.items()
+            )
 
         if self.error_types:
-            summary += "\nError Types:\n"
-            for error_type, count in self.error_types.items():
-                summary += f"  {error_type.name}: {count}\n"
+            parts.append("\nError Types:\n")
+            parts.extend(
+                f"  {error_type.name}: {count}\n"
+                for error_type, count in self.error_types.items()
+            )
 
-        return summary
+        return "".join(parts)
 
     def __str__(self) -> str:
         """Return string representation of stats."""
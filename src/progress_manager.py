@@ -30,7 +30,8 @@ class ProgressManager:
         self.file_bar = tqdm(
             total=total_files,
             desc="Processing Markdown Files",
-            unit="files"
+            unit="files",
+            disable=None  # No-op when output is not a terminal
         )
 
     def start_attachment_progress(self, total_attachments: int) -> None:
@@ -42,11 +43,15 @@ class ProgressManager:
         if self.attach_bar:
             self.attach_bar.close()
 
+        # Only check for a redraw roughly every 1% of attachments, so notes
+        # with many small attachments skip most redraw checks
         self.attach_bar = tqdm(
             total=total_attachments,
             desc="Processing Attachments",
             unit="att",
-            leave=False  # Don't leave this bar when done
+            leave=False,  # Don't leave this bar when done
+            miniters=max(1, total_attachments // 100),
+            disable=None  # No-op when output is not a terminal
         )
 
     def update_file_progress(self, amount: int = 1) -> None:
@@ -0,0 +1,80 @@
+"""Client-side request and token rate limiting for API calls."""
+
+import logging
+import threading
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """Token buckets for requests and tokens per minute.
+
+    Callers reserve capacity before each request and wait for the returned
+    delay. Reservations may overdraw the buckets, so concurrent callers are
+    spaced out in the order they reserved instead of all retrying at once.
+    The limiter only computes delays, so it serves both threads and asyncio
+    tasks.
+    """
+
+    def __init__(
+        self,
+        max_requests_per_minute: Optional[float] = None,
+        max_tokens_per_minute: Optional[float] = None,
+        cooldown: float = 60.0,
+    ) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            max_requests_per_minute: Request limit, or None for no limit
+            max_tokens_per_minute: Token limit, or None for no limit
+            cooldown: Seconds the rates stay halved after a rate limit error
+        """
+        self.max_requests_per_minute = max_requests_per_minute
+        self.max_tokens_per_minute = max_tokens_per_minute
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._requests = max_requests_per_minute or 0.0
+        self._tokens = max_tokens_per_minute or 0.0
+        self._updated = time.monotonic()
+        self._slow_until = 0.0
+
+    def reserve(self, tokens: int) -> float:
+        """Reserve capacity for one request.
+
+        Args:
+            tokens: Estimated tokens the request counts against the limit
+
+        Returns:
+            Seconds to wait before sending the request
+        """
+        with self._lock:
+            now = time.monotonic()
+            scale = 0.5 if now < self._slow_until else 1.0
+            elapsed = now - self._updated
+            self._updated = now
+
+            delay = 0.0
+            if self.max_requests_per_minute:
+                rate = self.max_requests_per_minute / 60 * scale
+                self._requests = min(
+                    self.max_requests_per_minute, self._requests + elapsed * rate
+                )
+                self._requests -= 1
+                delay = max(delay, -self._requests / rate)
+            if self.max_tokens_per_minute:
+                rate = self.max_tokens_per_minute / 60 * scale
+                self._tokens = min(
+                    self.max_tokens_per_minute, self._tokens + elapsed * rate
+                )
+                self._tokens -= tokens
+                delay = max(delay, -self._tokens / rate)
+            return delay
+
+    def slow_down(self) -> None:
+        """Halve the refill rates for the cooldown after a rate limit error."""
+        with self._lock:
+            if time.monotonic() >= self._slow_until:
+                logger.info("Rate limited; halving request rate for %ss", self.cooldown)
+            self._slow_until = time.monotonic() + self.cooldown
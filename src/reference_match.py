@@ -1,24 +1,68 @@
 """Reference matching and parsing for markdown content."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import json
 import logging
 import re
-from typing import List
+import types
+from typing import Any, Iterator, List, Mapping
 
 logger = logging.getLogger(__name__)
 
+# Links/images followed by optional HTML comments containing metadata. The
+# text and path use negated classes rather than lazy wildcards, so a "[" that
+# starts no link fails at the next "]" instead of searching the rest of the
+# line, and link text cannot span an earlier "]".
+REFERENCE_RE = re.compile(
+    r"(?:!\[([^\]\n]*)\]|\[([^\]\n]*)\])\(([^)\n]*)\)(?:<!--\s*(.*?)\s*-->)?"
+)
 
-@dataclass
+# Read-only metadata shared by every reference without a metadata comment
+EMPTY_METADATA: Mapping[str, Any] = types.MappingProxyType({})
+
+
+@dataclass(slots=True, frozen=True)
 class ReferenceMatch:
-    """Represents a reference match in markdown content."""
+    """Represents a reference match in markdown content.
+
+    Instances are immutable and hashable, ignoring the metadata. References
+    without metadata share the read-only EMPTY_METADATA mapping.
+    """
 
     original_text: str
     alt_text: str
     link_path: str
     embed: bool
     is_image: bool
-    metadata: dict
+    metadata: Mapping[str, Any] = field(hash=False)
+
+
+def _reference_matches(content: str) -> Iterator[re.Match[str]]:
+    """Yield the same matches as REFERENCE_RE.finditer, skipping ahead with find.
+
+    Every reference contains "](", and its text cannot contain "]" or a
+    newline. So the regex only has to start at the last "]" or newline
+    before the next "](", and str.find skips the text between references
+    much faster than the regex engine scans it.
+
+    Args:
+        content: The markdown content to search
+
+    Yields:
+        Reference matches in document order
+    """
+    pos = 0
+    while (anchor := content.find("](", pos)) >= 0:
+        start = max(
+            pos,
+            content.rfind("]", pos, anchor) + 1,
+            content.rfind("\n", pos, anchor) + 1,
+        )
+        match = REFERENCE_RE.search(content, start)
+        if match is None:
+            return
+        yield match
+        pos = match.end()
 
 
 def find_markdown_references(content: str) -> List[ReferenceMatch]:
@@ -33,20 +77,33 @@ def find_markdown_references(content: str) -> List[ReferenceMatch]:
     Returns:
         List of ReferenceMatch objects
     """
-    # Match links/images followed by optional HTML comments containing metadata
-    pattern = r"(?:!\[(.*?)\]|\[(.*?)\])\((.*?)\)(?:<!--\s*(.*?)\s*-->)?"
-    references = []
+    return list(iter_markdown_references(content))
+
+
+def iter_markdown_references(content: str) -> Iterator[ReferenceMatch]:
+    """Iterate over references in markdown content as they are found.
 
-    for match in re.finditer(pattern, content):
+    Like find_markdown_references, but yields each reference lazily, for
+    callers that only need to scan them once or stop early.
+
+    Args:
+        content: The markdown content to search
+
+    Yields:
+        ReferenceMatch objects in document order
+    """
+    for match in _reference_matches(content):
         # Group 1 is image alt text, Group 2 is link alt text
-        is_image = match.group(1) is not None
-        alt_text = match.group(1) or match.group(2) or ""
-        link_path = match.group(3)
-        metadata_str = match.group(4)
-
-        # Parse metadata if present
-        metadata = {}
-        if metadata_str:
+        original_text, image_alt, link_alt, link_path, metadata_str = match.group(
+            0, 1, 2, 3, 4
+        )
+        is_image = image_alt is not None
+        alt_text = image_alt or link_alt or ""
+
+        # Parse metadata if present; other comments are not JSON objects, so
+        # they skip the parser (the pattern already strips whitespace)
+        metadata = EMPTY_METADATA
+        if metadata_str and metadata_str.startswith("{"):
             try:
                 metadata = json.loads(metadata_str)
             except json.JSONDecodeError:
@@ -55,14 +112,11 @@ def find_markdown_references(content: str) -> List[ReferenceMatch]:
         # All references are embedded by default unless explicitly disabled
         embed = metadata.get("embed", True)
 
-        ref = ReferenceMatch(
-            original_text=match.group(0),
+        yield ReferenceMatch(
+            original_text=original_text,
             alt_text=alt_text,
             link_path=link_path,
             embed=embed,
             is_image=is_image,
             metadata=metadata,
         )
-        references.append(ref)
-
-    return references
@@ -1,9 +1,8 @@
 """Test configuration and fixtures."""
 
+import contextlib
 import os
 from pathlib import Path
-import shutil
-import time
 from typing import Any, Generator
 
 import pytest
@@ -23,12 +22,9 @@ def clean_tmp_path(tmp_path: Path) -> Generator[Path, None, None]:
     test_dir = tmp_path / "test"
     test_dir.mkdir(parents=True, exist_ok=True)
 
+    # pytest removes tmp_path itself, along with old base temp directories
     yield test_dir
 
-    # Clean up
-    if test_dir.exists():
-        shutil.rmtree(test_dir)
-
 
 @pytest.hookimpl
 def pytest_sessionfinish(session: Any, exitstatus: int) -> None:
@@ -45,22 +41,18 @@ def pytest_sessionfinish(session: Any, exitstatus: int) -> None:
     if not base_temp:
         return
 
-    # Try cleanup multiple times with delays to handle locked files
-    max_retries = 3
-    for attempt in range(max_retries):
-        remaining_dirs = []
-        for root, dirs, _files in os.walk(str(base_temp), topdown=False):
-            for d in dirs:
-                if d == ".nova":
-                    nova_dir = os.path.join(root, d)
-                    try:
-                        shutil.rmtree(nova_dir)
-                    except OSError:
-                        remaining_dirs.append(nova_dir)
-
-        if not remaining_dirs:
-            break
-
-        # Wait before retrying
-        if attempt < max_retries - 1:
-            time.sleep(0.1 * (attempt + 1))
+    # A single bottom-up walk empties each .nova directory before removing it
+    for root, dirs, files in os.walk(str(base_temp), topdown=False):
+        in_nova = ".nova" in Path(root).parts
+        if in_nova:
+            for name in files:
+                with contextlib.suppress(OSError):
+                    os.unlink(os.path.join(root, name))
+        for name in dirs:
+            if in_nova or name == ".nova":
+                path = os.path.join(root, name)
+                with contextlib.suppress(OSError):
+                    if os.path.islink(path):
+                        os.unlink(path)
+                    else:
+                        os.rmdir(path)
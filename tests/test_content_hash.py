@@ -0,0 +1,53 @@
+"""Tests for content digests."""
+
+from pathlib import Path
+
+import pytest
+
+from src.content_hash import DigestMemo, file_digest
+
+
+def test_digest_follows_content(tmp_path: Path) -> None:
+    """Test that digests depend on content, not file names."""
+    first = tmp_path / "first.bin"
+    second = tmp_path / "second.bin"
+    first.write_bytes(b"same content")
+    second.write_bytes(b"same content")
+    assert file_digest(first) == file_digest(second)
+
+    second.write_bytes(b"other content")
+    assert file_digest(first) != file_digest(second)
+
+
+def test_empty_file(tmp_path: Path) -> None:
+    """Test that empty files can be hashed."""
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+    assert file_digest(empty)
+
+
+def test_missing_file(tmp_path: Path) -> None:
+    """Test that missing files raise OSError."""
+    with pytest.raises(OSError):
+        file_digest(tmp_path / "missing.bin")
+
+
+def test_memo_reuses_digest_for_unchanged_stat(tmp_path: Path) -> None:
+    """Test that a known size and mtime reuse the previous digest."""
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"some content")
+    st = path.stat()
+    memo = DigestMemo()
+    digest = memo.file_digest(path, st)
+    assert digest == file_digest(path)
+
+    # Same stat signature: the file is not read again
+    path.unlink()
+    assert memo.file_digest(path, st) == digest
+
+    # A different signature, or no stat at all, forces a re-hash
+    path.write_bytes(b"new content")
+    assert memo.file_digest(path, path.stat()) == file_digest(path)
+    path.unlink()
+    with pytest.raises(OSError):
+        memo.file_digest(path)
@@ -0,0 +1,107 @@
+"""Tests for conversion result caching."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pytest
+
+from src.conversion_cache import ConversionCache
+
+
+@pytest.fixture
+def conversion_cache(tmp_path: Path) -> ConversionCache:
+    """Create a test conversion cache."""
+    return ConversionCache(cbm_dir=tmp_path)
+
+
+def test_put_and_get(conversion_cache: ConversionCache, tmp_path: Path) -> None:
+    """Test storing and retrieving a conversion result."""
+    test_file = tmp_path / "test.json"
+    test_file.write_text('{"a": 1}')
+
+    key = conversion_cache.key_for(test_file, "json")
+    assert key is not None
+    assert conversion_cache.get(key) is None
+
+    result = {"success": True, "content": "converted", "error": None}
+    conversion_cache.put(key, result)
+    assert conversion_cache.get(key) == result
+
+
+def test_content_change_misses(
+    conversion_cache: ConversionCache, tmp_path: Path
+) -> None:
+    """Test that changed file content produces a new key."""
+    test_file = tmp_path / "test.txt"
+    test_file.write_text("first")
+    key = conversion_cache.key_for(test_file, "text")
+    conversion_cache.put(key, {"success": True, "content": "first"})
+
+    test_file.write_text("second")
+    new_key = conversion_cache.key_for(test_file, "text")
+    assert new_key != key
+    assert conversion_cache.get(new_key) is None
+
+
+def test_version_invalidation(tmp_path: Path) -> None:
+    """Test that results from another format version are dropped."""
+    test_file = tmp_path / "test.txt"
+    test_file.write_text("content")
+
+    cache = ConversionCache(cbm_dir=tmp_path, version=1)
+    key = cache.key_for(test_file, "text")
+    cache.put(key, {"success": True, "content": "v1"})
+    cache.close()
+
+    assert ConversionCache(cbm_dir=tmp_path, version=1).get(key) is not None
+    assert ConversionCache(cbm_dir=tmp_path, version=2).get(key) is None
+
+
+def test_missing_file(conversion_cache: ConversionCache, tmp_path: Path) -> None:
+    """Test that unreadable files have no cache key."""
+    assert conversion_cache.key_for(tmp_path / "missing.txt", "text") is None
+
+
+def test_cleanup(conversion_cache: ConversionCache) -> None:
+    """Test cache cleanup removes the database."""
+    assert conversion_cache.cache_path.exists()
+    conversion_cache.cleanup()
+    assert not conversion_cache.cache_path.exists()
+
+
+def test_unchanged_stat_skips_rehash(
+    conversion_cache: ConversionCache, tmp_path: Path
+) -> None:
+    """Test that a known size and mtime reuse the previous digest."""
+    test_file = tmp_path / "test.txt"
+    test_file.write_text("content")
+    st = test_file.stat()
+    key = conversion_cache.key_for(test_file, "text", st)
+
+    # Same stat signature: the file is not read again
+    test_file.unlink()
+    assert conversion_cache.key_for(test_file, "text", st) == key
+
+    # A different signature forces a re-hash
+    test_file.write_text("changed")
+    new_key = conversion_cache.key_for(test_file, "text", test_file.stat())
+    assert new_key is not None and new_key != key
+
+
+def test_shared_across_threads(
+    conversion_cache: ConversionCache, tmp_path: Path
+) -> None:
+    """Test that worker threads can share the cache."""
+    test_file = tmp_path / "test.txt"
+    test_file.write_text("content")
+    key = conversion_cache.key_for(test_file, "text")
+    assert key is not None
+
+    def roundtrip(i: int) -> Optional[Dict[str, Any]]:
+        conversion_cache.put(f"{key}:{i}", {"success": True, "content": str(i)})
+        return conversion_cache.get(f"{key}:{i}")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(roundtrip, range(20)))
+    assert [r["content"] for r in results if r] == [str(i) for i in range(20)]
@@ -15,9 +15,9 @@ from src.converters.text_converter import TextConverter
 from src.file_converter import ConversionResult
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_openai() -> Generator[MagicMock, None, None]:
-    """Mock OpenAI client."""
+    """Mock OpenAI client, shared by the module since no test reconfigures it."""
     mock_client = MagicMock()
     mock_response = MagicMock()
     mock_response.choices = [MagicMock(message=MagicMock(content="Test description"))]
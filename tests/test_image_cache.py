@@ -90,3 +90,86 @@ def test_error_handling(image_cache: ImageCache, tmp_path: Path) -> None:
     non_existent = tmp_path / "nonexistent.jpg"
     assert image_cache.get_cached_path(non_existent) is None
     assert not image_cache.is_processed(non_existent)
+
+
+def test_description_persists(image_cache: ImageCache, tmp_path: Path) -> None:
+    """Test descriptions survive cleanup and new cache instances."""
+    test_image = tmp_path / "test.jpg"
+    test_image.write_bytes(b"test image data")
+
+    # Initially there is no description
+    assert image_cache.get_description(test_image) is None
+
+    image_cache.set_description(test_image, "A description")
+    image_cache.cleanup()
+
+    # A fresh cache finds the description, including for a renamed copy
+    copy = tmp_path / "copy.jpg"
+    copy.write_bytes(b"test image data")
+    new_cache = ImageCache(cbm_dir=tmp_path)
+    assert new_cache.get_description(test_image) == "A description"
+    assert new_cache.get_description(copy) == "A description"
+
+
+def test_description_keyed_by_content(image_cache: ImageCache, tmp_path: Path) -> None:
+    """Test changed image content misses the description cache."""
+    test_image = tmp_path / "test.jpg"
+    test_image.write_bytes(b"test image data")
+    image_cache.set_description(test_image, "Old description")
+
+    test_image.write_bytes(b"new image data")
+    assert image_cache.get_description(test_image) is None
+    assert image_cache.get_description(tmp_path / "nonexistent.jpg") is None
+
+
+def test_description_keyed_by_model(tmp_path: Path) -> None:
+    """Test descriptions from another model are not reused."""
+    test_image = tmp_path / "test.jpg"
+    test_image.write_bytes(b"test image data")
+
+    ImageCache(cbm_dir=tmp_path, model="model-a").set_description(
+        test_image, "From model A"
+    )
+    assert (
+        ImageCache(cbm_dir=tmp_path, model="model-b").get_description(test_image)
+        is None
+    )
+    assert (
+        ImageCache(cbm_dir=tmp_path, model="model-a").get_description(test_image)
+        == "From model A"
+    )
+
+
+def test_unchanged_stat_skips_rehash(image_cache: ImageCache, tmp_path: Path) -> None:
+    """Test a known size and mtime reuse the previous digest."""
+    test_image = tmp_path / "test.jpg"
+    test_image.write_bytes(b"test image data")
+    st = test_image.stat()
+    image_cache.set_description(test_image, "A description", st)
+
+    # Same stat signature: the file is not read again
+    test_image.unlink()
+    assert image_cache.get_description(test_image, st) == "A description"
+
+    # A different signature forces a re-hash
+    test_image.write_bytes(b"new image data")
+    assert image_cache.get_description(test_image, test_image.stat()) is None
+
+
+def test_description_database_opened_lazily(tmp_path: Path) -> None:
+    """Test the description database is only created once it is used."""
+    image_cache = ImageCache(cbm_dir=tmp_path)
+    database = image_cache.descriptions_path
+    assert not database.exists()
+
+    test_image = tmp_path / "test.jpg"
+    test_image.write_bytes(b"test image data")
+    image_cache.set_description(test_image, "A description")
+    assert database.exists()
+
+    # Cleanup closes the connection, which removes the WAL files
+    image_cache.cleanup()
+    assert not Path(f"{database}-wal").exists()
+    assert not Path(f"{database}-shm").exists()
+    assert image_cache.get_description(test_image) == "A description"
+    image_cache.close()
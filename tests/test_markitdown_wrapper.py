@@ -0,0 +1,658 @@
+"""Tests for the MarkItDown wrapper."""
+
+import asyncio
+import base64
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import io
+import json
+from pathlib import Path
+import threading
+from typing import Any, Callable, Dict, Iterator, List
+from unittest.mock import MagicMock
+from urllib.parse import urlsplit
+
+from openai import RateLimitError
+from PIL import Image
+import pytest
+
+from src.markitdown_wrapper import (
+    MARKITDOWN_CACHE_SIZE,
+    MAX_IMAGE_SIDE,
+    MarkItDownWrapper,
+    _split_batch_response,
+    clear_markitdown_cache,
+    create_success_result,
+    read_image_size,
+)
+
+
+@pytest.fixture
+def wrapper(tmp_path: Path) -> MarkItDownWrapper:
+    """Create a wrapper around a mock OpenAI client."""
+    return MarkItDownWrapper(MagicMock(), cbm_dir=tmp_path / ".cbm")
+
+
+def test_markitdown_shared_per_client(tmp_path: Path) -> None:
+    """Test that wrappers share converters per client, in a bounded cache."""
+    clear_markitdown_cache()
+    client = MagicMock()
+    first = MarkItDownWrapper(client, cbm_dir=tmp_path / "first")
+    second = MarkItDownWrapper(client, cbm_dir=tmp_path / "second")
+    other = MarkItDownWrapper(MagicMock(), cbm_dir=tmp_path / "other")
+    assert first.markitdown is second.markitdown
+    assert other.markitdown is not first.markitdown
+
+    # Converters for other clients push out the least recently used one
+    shared = first.markitdown
+    for _ in range(MARKITDOWN_CACHE_SIZE):
+        wrapper = MarkItDownWrapper(MagicMock(), cbm_dir=tmp_path / "other")
+        assert wrapper.markitdown is not shared
+    assert first.markitdown is not shared
+
+    shared = first.markitdown
+    clear_markitdown_cache()
+    assert first.markitdown is not shared
+
+
+def decode_image_url(image_url: str) -> Image.Image:
+    """Decode a base64 data URL into a PIL image."""
+    _, data = image_url.split(",", 1)
+    return Image.open(io.BytesIO(base64.b64decode(data)))
+
+
+def test_encode_image_flattens_transparency(
+    wrapper: MarkItDownWrapper, tmp_path: Path
+) -> None:
+    """Test that a downscaled transparent PNG keeps its content on white."""
+    image_path = tmp_path / "transparent.png"
+    img = Image.new("RGBA", (3000, 3000), (0, 0, 0, 0))
+    img.paste((0, 0, 0, 255), (1000, 1000, 2000, 2000))
+    img.save(image_path)
+
+    image_url = wrapper._encode_image(image_path)
+    assert image_url is not None and image_url.startswith("data:image/jpeg")
+    with decode_image_url(image_url) as encoded:
+        assert encoded.size == (MAX_IMAGE_SIDE, MAX_IMAGE_SIDE)
+        rgb = encoded.convert("RGB")
+        assert min(rgb.getpixel((10, 10))) > 240  # Transparent area is white
+        assert max(rgb.getpixel((1024, 1024))) < 15  # Content stays black
+
+
+def test_encode_image_applies_exif_orientation(
+    wrapper: MarkItDownWrapper, tmp_path: Path
+) -> None:
+    """Test that a rotated phone photo is sent upright."""
+    image_path = tmp_path / "portrait.jpg"
+    exif = Image.Exif()
+    exif[0x0112] = 6  # Orientation: rotate 90 degrees clockwise to display
+    Image.new("RGB", (4000, 3000), (200, 50, 50)).save(image_path, exif=exif)
+
+    image_url = wrapper._encode_image(image_path)
+    assert image_url is not None
+    with decode_image_url(image_url) as encoded:
+        assert encoded.size == (1536, 2048)
+
+
+def test_encode_large_transparent_png(
+    wrapper: MarkItDownWrapper, tmp_path: Path
+) -> None:
+    """Test that a large PNG within the size limit is re-encoded onto white."""
+    image_path = tmp_path / "screenshot.png"
+    noise = Image.effect_noise((1200, 1200), 100).convert("L")
+    img = Image.merge("LA", (noise, Image.new("L", noise.size, 0)))
+    img.paste((0, 255), (0, 0, 600, 1200))
+    img.save(image_path)
+    assert image_path.stat().st_size >= 500 * 1024
+
+    image_url = wrapper._encode_image(image_path)
+    assert image_url is not None and image_url.startswith("data:image/jpeg")
+    with decode_image_url(image_url) as encoded:
+        assert encoded.size == (1200, 1200)
+        rgb = encoded.convert("RGB")
+        assert max(rgb.getpixel((100, 600))) < 15  # Opaque black half
+        assert min(rgb.getpixel((1100, 600))) > 240  # Transparent half is white
+
+
+HTML_DOCUMENT = (
+    "<!DOCTYPE html><html><head><title>T</title><style>p { color: red }</style>"
+    "<script>var config = {};</script></head>"
+    "<body><!-- note --><h1>Heading</h1><p>Hello <b>bold</b> text</p>"
+    "<script>track()</script><template><p>Hidden</p></template>"
+    "<ul><li>One</li><li>Two</li></ul></body></html>"
+)
+
+
+def text_lines(text: str) -> list[str]:
+    """Split extracted text into non-blank lines, ignoring spacing."""
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+
+@pytest.mark.parametrize(
+    "selectolax, lxml",
+    [(True, False), (False, True), (False, False)],
+    ids=["selectolax", "lxml", "html.parser"],
+)
+def test_extract_html_text_matches_beautifulsoup(
+    wrapper: MarkItDownWrapper,
+    monkeypatch: pytest.MonkeyPatch,
+    selectolax: bool,
+    lxml: bool,
+) -> None:
+    """Test that every parser extracts the text BeautifulSoup did."""
+    from bs4 import BeautifulSoup
+
+    if selectolax:
+        pytest.importorskip("selectolax")
+    if lxml:
+        pytest.importorskip("lxml")
+    monkeypatch.setattr("src.markitdown_wrapper.SELECTOLAX_SUPPORT", selectolax)
+    monkeypatch.setattr("src.markitdown_wrapper.LXML_SUPPORT", lxml)
+
+    expected = BeautifulSoup(HTML_DOCUMENT, "html.parser").get_text(separator="\n\n")
+    text = wrapper._extract_html_text(HTML_DOCUMENT)
+    assert text_lines(text) == text_lines(expected)
+    assert "track()" not in text and "Hidden" not in text
+
+
+@pytest.mark.parametrize(
+    "document, expected",
+    [
+        ('{"id": 123456789012345678901234567890}', "123456789012345678901234567890"),
+        ('{"max": 18446744073709551615}', "18446744073709551615"),
+        ('{"ratio": NaN, "limit": Infinity}', '"limit": Infinity'),
+        ('{"name": "Bear", "tags": [1, 2]}', '"name": "Bear"'),
+    ],
+    ids=["big-int", "u64", "nan", "plain"],
+)
+def test_handle_json_file_round_trips(
+    wrapper: MarkItDownWrapper, tmp_path: Path, document: str, expected: str
+) -> None:
+    """Test that JSON values the json module accepts are embedded exactly."""
+    json_path = tmp_path / "data.json"
+    json_path.write_text(document)
+
+    result = wrapper._handle_json_file(json_path)
+    assert result["success"] is True
+    assert expected in result["content"]
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        (b"line1\r\nline2\r\n", "```\nline1\nline2\n\n```"),
+        (b"line1\rline2", "```\nline1\nline2\n```"),
+        (b"caf\xe9\r\n", "```\ncaf\u00e9\n\n```"),
+    ],
+    ids=["crlf", "cr", "latin1-crlf"],
+)
+def test_handle_text_file_normalizes_newlines(
+    wrapper: MarkItDownWrapper, tmp_path: Path, data: bytes, expected: str
+) -> None:
+    """Test that text attachments get universal newlines, as text mode reads do."""
+    text_path = tmp_path / "notes.txt"
+    text_path.write_bytes(data)
+
+    result = wrapper._handle_text_file(text_path)
+    assert result["success"] is True
+    assert expected in result["content"]
+    assert "\r" not in result["content"]
+
+
+def test_process_markdown_overlapping_paths(wrapper: MarkItDownWrapper) -> None:
+    """Test that a reference rewrites to its own path, not a prefix's."""
+    content = "![](photo (1).png) and ![](photo (1)"
+    processed = wrapper.process_markdown(
+        content,
+        {"photo (1": Path("out/short.png"), "photo (1).png": Path("out/long.png")},
+    )
+    assert processed == "![](out/long.png) and ![](out/short.png)"
+
+
+def test_process_markdown_does_not_cascade(wrapper: MarkItDownWrapper) -> None:
+    """Test that a rewritten path is not rewritten again by a later mapping."""
+    content = "![](a.png)\n![](b.png)\n[doc](a.png)"
+    processed = wrapper.process_markdown(
+        content, {"a.png": Path("b.png"), "b.png": Path("c.png")}
+    )
+    assert processed == "![](b.png)\n![](c.png)\n[doc](b.png)"
+
+
+def test_process_markdown_without_matches(wrapper: MarkItDownWrapper) -> None:
+    """Test that a note without known references comes back unchanged."""
+    content = "# Note\n\n![](other.png) mentions a.png outside a link"
+    assert wrapper.process_markdown(content, {"a.png": Path("b.png")}) is content
+    assert wrapper.process_markdown(content, {}) is content
+
+
+@pytest.mark.parametrize(
+    "csv_text",
+    [
+        "a,b,c\n1,2\n",
+        "a,a,b\n1,2,3\n",
+        "id,x\n123456789012345678901,1\n",
+        "name,score\nBear,1.5\nPanda,2\n",
+    ],
+    ids=["short-row", "duplicate-header", "big-int", "plain"],
+)
+def test_handle_spreadsheet_matches_c_engine(
+    wrapper: MarkItDownWrapper, tmp_path: Path, csv_text: str
+) -> None:
+    """Test that CSVs render as they do with pandas' C engine."""
+    import pandas as pd
+
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(csv_text)
+
+    result = wrapper._handle_spreadsheet_file(csv_path)
+    assert result["success"] is True
+    expected = pd.read_csv(io.StringIO(csv_text)).to_markdown(index=False)
+    assert expected in result["content"]
+
+
+@pytest.mark.parametrize(
+    "suffix, save_args",
+    [
+        (".jpg", {"format": "JPEG"}),
+        (".jpg", {"format": "JPEG", "progressive": True}),
+        (".png", {"format": "PNG"}),
+        (".gif", {"format": "GIF"}),
+    ],
+    ids=["baseline-jpeg", "progressive-jpeg", "png", "gif"],
+)
+def test_read_image_size_from_header(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    suffix: str,
+    save_args: dict,
+) -> None:
+    """Test that common formats are sized from their headers alone."""
+    image_path = tmp_path / f"image{suffix}"
+    Image.new("RGB", (321, 123), (10, 20, 30)).save(image_path, **save_args)
+
+    def fail(_: Path) -> None:
+        raise AssertionError("PIL fallback used")
+
+    monkeypatch.setattr("src.markitdown_wrapper._open_image", fail)
+    assert read_image_size(image_path) == (321, 123)
+
+
+def test_read_image_size_jpeg_with_exif_and_fill_bytes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that APP1 segments and 0xFF fill bytes before the frame are skipped."""
+    exif = Image.Exif()
+    exif[0x0112] = 6
+    buffer = io.BytesIO()
+    Image.new("RGB", (640, 480)).save(buffer, format="JPEG", exif=exif)
+    data = buffer.getvalue()
+    assert b"Exif\x00\x00" in data  # APP1 segment ahead of the frame header
+    image_path = tmp_path / "photo.jpg"
+    image_path.write_bytes(data[:2] + b"\xff\xff" + data[2:])
+
+    monkeypatch.setattr("src.markitdown_wrapper._open_image", None)
+    # Stored dimensions, before the EXIF orientation is applied
+    assert read_image_size(image_path) == (640, 480)
+
+
+def test_read_image_size_truncated(tmp_path: Path) -> None:
+    """Test that truncated files report no size."""
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 64)).save(buffer, format="JPEG")
+    for suffix, data in [
+        (".jpg", buffer.getvalue()[:40]),
+        (".png", b"\x89PNG\r\n\x1a\n\x00\x00"),
+        (".gif", b"GIF89a\x01"),
+    ]:
+        image_path = tmp_path / f"truncated{suffix}"
+        image_path.write_bytes(data)
+        assert read_image_size(image_path) is None
+
+
+def test_read_image_size_pil_fallback(tmp_path: Path) -> None:
+    """Test that other formats are sized by PIL."""
+    image_path = tmp_path / "image.bmp"
+    Image.new("RGB", (50, 70)).save(image_path)
+    assert read_image_size(image_path) == (50, 70)
+
+
+def test_split_batch_response() -> None:
+    """Test splitting a batched reply into one description per image."""
+    reply = "Here you go.\n=== IMAGE 1 ===\nA cat.\n\n=== IMAGE 2 ===\nA dog.\n"
+    assert _split_batch_response(reply, 2) == ["A cat.", "A dog."]
+
+    # Wrong count, reordered or empty sections are rejected
+    assert _split_batch_response(reply, 3) is None
+    swapped = "=== IMAGE 2 ===\nA dog.\n=== IMAGE 1 ===\nA cat."
+    assert _split_batch_response(swapped, 2) is None
+    empty = "=== IMAGE 1 ===\n\n=== IMAGE 2 ===\nA dog."
+    assert _split_batch_response(empty, 2) is None
+    assert _split_batch_response("A cat and a dog.", 2) is None
+
+
+def chat_reply(content: str) -> MagicMock:
+    """Build a chat completion response with the given message content."""
+    return MagicMock(choices=[MagicMock(message=MagicMock(content=content))])
+
+
+def image_count(messages: List[Any]) -> int:
+    """Count the images in a chat request."""
+    parts = messages[0]["content"]
+    return sum(1 for part in parts if part["type"] == "image_url")
+
+
+def make_images(tmp_path: Path, count: int) -> List[Path]:
+    """Create distinct small PNG images."""
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"image{i}.png"
+        Image.new("RGB", (8 + i, 8)).save(path)
+        paths.append(path)
+    return paths
+
+
+def well_formed(messages: List[Any]) -> MagicMock:
+    """Reply with one delimited section per image."""
+    count = image_count(messages)
+    sections = [f"=== IMAGE {n} ===\nImage {n} of {count}" for n in range(1, count + 1)]
+    return chat_reply("\n".join(sections))
+
+
+def reordered(messages: List[Any]) -> MagicMock:
+    """Reply to batches with sections out of order, and to single images plainly."""
+    count = image_count(messages)
+    if count == 1:
+        return chat_reply("Single description")
+    sections = [f"=== IMAGE {n} ===\nImage {n}" for n in range(count, 0, -1)]
+    return chat_reply("\n".join(sections))
+
+
+def test_process_images_batch(wrapper: MarkItDownWrapper, tmp_path: Path) -> None:
+    """Test that uncached images are described four per request and cached."""
+    paths = make_images(tmp_path, 6)
+    create = wrapper.client.chat.completions.create
+    create.side_effect = lambda model, messages: well_formed(messages)
+
+    results = wrapper.process_images_batch(paths)
+    calls = create.call_args_list
+    assert [image_count(call.kwargs["messages"]) for call in calls] == [4, 2]
+    assert [result["text"] for result in results] == [
+        "Image 1 of 4",
+        "Image 2 of 4",
+        "Image 3 of 4",
+        "Image 4 of 4",
+        "Image 1 of 2",
+        "Image 2 of 2",
+    ]
+
+    # Descriptions are served from the cache on the next run
+    create.reset_mock()
+    assert wrapper.process_images_batch(paths) == results
+    create.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "reply",
+    [reordered, lambda messages: chat_reply("No delimiters at all")],
+    ids=["reordered", "missing-sections"],
+)
+def test_process_images_batch_falls_back(
+    wrapper: MarkItDownWrapper,
+    tmp_path: Path,
+    reply: Callable[[List[Any]], MagicMock],
+) -> None:
+    """Test that an unsplittable batch is retried one image per request."""
+    paths = make_images(tmp_path, 3)
+    create = wrapper.client.chat.completions.create
+    create.side_effect = lambda model, messages: reply(messages)
+
+    results = wrapper.process_images_batch(paths)
+    calls = create.call_args_list
+    assert [image_count(call.kwargs["messages"]) for call in calls] == [3, 1, 1, 1]
+    assert all(result["success"] for result in results)
+    assert len({result["text"] for result in results}) == 1
+
+
+def test_process_images_batch_missing_file(
+    wrapper: MarkItDownWrapper, tmp_path: Path
+) -> None:
+    """Test that a missing file fails alone and keeps its place in the results."""
+    paths = make_images(tmp_path, 2)
+    paths.insert(1, tmp_path / "missing.png")
+    create = wrapper.client.chat.completions.create
+    create.side_effect = lambda model, messages: well_formed(messages)
+
+    results = wrapper.process_images_batch(paths)
+    assert [result["success"] for result in results] == [True, False, True]
+    assert "not found" in results[1]["error"]
+    assert [results[0]["text"], results[2]["text"]] == ["Image 1 of 2", "Image 2 of 2"]
+    assert create.call_count == 1
+
+
+def rate_limit_error(headers: Dict[str, str]) -> RateLimitError:
+    """Build a 429 error whose response carries the given headers."""
+    response = MagicMock(status_code=429, headers=headers)
+    return RateLimitError("Rate limit reached", response=response, body=None)
+
+
+@pytest.mark.parametrize(
+    "headers, expected",
+    [
+        ({"retry-after-ms": "1500", "retry-after": "9"}, 1.5),
+        ({"retry-after": "2"}, 2.0),
+        ({"retry-after": "0.25"}, 0.25),
+        ({"retry-after": "120"}, 30.0),
+        ({"retry-after-ms": "90000"}, 30.0),
+    ],
+    ids=["ms-preferred", "seconds", "fractional", "capped", "ms-capped"],
+)
+def test_backoff_delay_honours_retry_after(
+    wrapper: MarkItDownWrapper, headers: Dict[str, str], expected: float
+) -> None:
+    """Test that rate limit responses set the delay, up to max_retry_delay."""
+    assert wrapper._backoff_delay(2, rate_limit_error(headers)) == expected
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        rate_limit_error({}),
+        rate_limit_error({"retry-after": "Wed, 21 Oct 2026 07:28:00 GMT"}),
+        rate_limit_error({"retry-after-ms": "soon"}),
+        ValueError("Connection reset"),
+    ],
+    ids=["no-header", "http-date", "malformed", "other-error"],
+)
+def test_backoff_delay_falls_back_to_exponential(
+    wrapper: MarkItDownWrapper, error: Exception
+) -> None:
+    """Test that without a usable header the delay doubles per attempt."""
+    for attempt in range(3):
+        base = wrapper.retry_delay * 2**attempt
+        delay = wrapper._backoff_delay(attempt, error)
+        assert base <= delay <= base + wrapper.retry_delay
+
+    wrapper.retry_delay = 10.0
+    assert wrapper._backoff_delay(2, error) == wrapper.max_retry_delay
+
+
+@pytest.mark.parametrize("concurrency", [0, -1])
+def test_convert_images_rejects_no_concurrency(
+    wrapper: MarkItDownWrapper, tmp_path: Path, concurrency: int
+) -> None:
+    """Test that convert_images refuses a concurrency that would drop images."""
+    with pytest.raises(ValueError, match="concurrency"):
+        asyncio.run(wrapper.convert_images(make_images(tmp_path, 2), concurrency))
+
+
+class InlineProcessPool(ThreadPoolExecutor):
+    """Process pool stand-in that runs work on threads of this process."""
+
+    def __init__(
+        self, max_workers: int, mp_context: Any, initializer: Any, initargs: Any
+    ) -> None:
+        super().__init__(max_workers)
+        self.mp_context = mp_context
+
+
+@pytest.mark.parametrize("processes", [False, True], ids=["threads", "processes"])
+def test_convert_files_order_and_cache(
+    wrapper: MarkItDownWrapper,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    processes: bool,
+) -> None:
+    """Test that results keep the input order and are cached across calls."""
+    converted: List[str] = []
+
+    def convert(file_path: Path, file_type: str, st: Any = None) -> Dict[str, Any]:
+        converted.append(file_path.name)
+        return create_success_result(f"Converted {file_path.name}", file_type)
+
+    monkeypatch.setattr(wrapper, "_convert_by_type", convert)
+    monkeypatch.setattr("src.markitdown_wrapper._convert_in_worker", convert)
+    monkeypatch.setattr("src.markitdown_wrapper.ProcessPoolExecutor", InlineProcessPool)
+    create = wrapper.client.chat.completions.create
+    create.return_value = chat_reply("A picture")
+    paths = make_images(tmp_path, 1)
+    for name in ["b.txt", "a.json", "c.html"]:
+        (tmp_path / name).write_text(name)
+        paths.append(tmp_path / name)
+
+    results = wrapper.convert_files(paths, processes=processes)
+    assert "A picture" in results[0]["content"]
+    assert [result["content"] for result in results[1:]] == [
+        "Converted b.txt",
+        "Converted a.json",
+        "Converted c.html",
+    ]
+    assert sorted(converted) == ["a.json", "b.txt", "c.html"]
+    if processes:
+        pool = wrapper._process_pool()
+        assert isinstance(pool, InlineProcessPool)
+        assert pool.mp_context.get_start_method() in ("forkserver", "spawn")
+
+    # Everything is served from the caches on the next call
+    converted.clear()
+    assert wrapper.convert_files(paths, processes=processes) == results
+    assert converted == []
+    assert create.call_count == 1
+    wrapper.cleanup()
+
+
+class FakeAPIHandler(BaseHTTPRequestHandler):
+    """Answer chat completions with a fixed reply and accept PUT uploads."""
+
+    # Keep connections open so clients pool them, as with the real API
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        self.server.requests.append(  # type: ignore[attr-defined]
+            (self.command, self.path, dict(self.headers), self._read_body())
+        )
+        body = json.dumps(
+            {
+                "id": "chatcmpl-test",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "gpt-4o",
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": "A picture"},
+                        "finish_reason": "stop",
+                    }
+                ],
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_PUT(self) -> None:
+        self.server.requests.append(  # type: ignore[attr-defined]
+            (self.command, self.path, dict(self.headers), self._read_body())
+        )
+        # Like S3 presigned URLs, uploads need an explicit length
+        self.send_response(200 if "Content-Length" in self.headers else 411)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _read_body(self) -> bytes:
+        length = self.headers.get("Content-Length")
+        return self.rfile.read(int(length)) if length else b""
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def fake_api() -> Iterator[ThreadingHTTPServer]:
+    """Run a local HTTP server standing in for the OpenAI API."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeAPIHandler)
+    server.requests = []  # type: ignore[attr-defined]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def api_wrapper(server: ThreadingHTTPServer, cbm_dir: Path, **kwargs: Any) -> Any:
+    """Create a wrapper whose OpenAI clients talk to the fake API server."""
+    from openai import OpenAI
+
+    host, port = server.server_address[:2]
+    client = OpenAI(
+        api_key="sk-test", base_url=f"http://{host}:{port}/v1", max_retries=0
+    )
+    return MarkItDownWrapper(client, cbm_dir=cbm_dir, **kwargs)
+
+
+# Clients left on a finished loop are only closed when garbage collected
+@pytest.mark.filterwarnings("ignore::ResourceWarning")
+def test_convert_images_across_event_loops(
+    fake_api: ThreadingHTTPServer, tmp_path: Path
+) -> None:
+    """Test that the async client is usable from a second asyncio.run."""
+    wrapper = api_wrapper(fake_api, tmp_path / ".cbm")
+    first, second, third = make_images(tmp_path, 3)
+
+    for image_path in (first, second):
+        results = asyncio.run(wrapper.convert_images([image_path]))
+        assert results[0]["success"], results[0]["error"]
+        assert "A picture" in results[0]["content"]
+
+    async def process_and_close() -> List[Any]:
+        async with wrapper:
+            return await wrapper.process_images([third])
+
+    results = asyncio.run(process_and_close())
+    assert results[0] == {"success": True, "text": "A picture", "error": None}
+    assert wrapper._async_client is None
+    assert len(fake_api.requests) == 3  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize("mmap_min_bytes", [0, 1 << 30], ids=["mmap", "bytes"])
+def test_upload_image_sends_content_length(
+    fake_api: ThreadingHTTPServer,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    mmap_min_bytes: int,
+) -> None:
+    """Test that images are uploaded with a Content-Length, mapped or not."""
+    monkeypatch.setattr("src.markitdown_wrapper.MMAP_MIN_BYTES", mmap_min_bytes)
+    host, port = fake_api.server_address[:2]
+    upload_url = f"http://{host}:{port}/uploads"
+    wrapper = api_wrapper(fake_api, tmp_path / ".cbm", image_upload_url=upload_url)
+    (image_path,) = make_images(tmp_path, 1)
+
+    image_url = wrapper._image_file_url(image_path)
+    assert image_url.startswith(f"{upload_url}/") and image_url.endswith(".png")
+    ((method, path, headers, body),) = fake_api.requests  # type: ignore[attr-defined]
+    assert (method, path) == ("PUT", urlsplit(image_url).path)
+    assert headers["Content-Length"] == str(image_path.stat().st_size)
+    assert "Transfer-Encoding" not in headers
+    assert body == image_path.read_bytes()
@@ -0,0 +1,39 @@
+"""Tests for client-side rate limiting."""
+
+import pytest
+
+from src.rate_limiter import RateLimiter
+
+
+def test_unlimited_never_waits() -> None:
+    """Test that a limiter without limits never delays requests."""
+    limiter = RateLimiter()
+    assert all(limiter.reserve(10_000) == 0 for _ in range(100))
+
+
+def test_requests_spaced_after_burst() -> None:
+    """Test that requests beyond the burst capacity are spaced out."""
+    limiter = RateLimiter(max_requests_per_minute=60)
+
+    # A full minute's worth of requests goes out immediately
+    assert all(limiter.reserve(1) == 0 for _ in range(60))
+
+    # Later ones queue up at one second apart
+    assert limiter.reserve(1) == pytest.approx(1, abs=0.05)
+    assert limiter.reserve(1) == pytest.approx(2, abs=0.05)
+
+
+def test_token_limit() -> None:
+    """Test that large requests wait for the token budget to refill."""
+    limiter = RateLimiter(max_tokens_per_minute=6000)
+    assert limiter.reserve(6000) == 0
+    assert limiter.reserve(3000) == pytest.approx(30, abs=0.1)
+
+
+def test_slow_down_halves_rate() -> None:
+    """Test that a rate limit error halves the refill rate."""
+    limiter = RateLimiter(max_requests_per_minute=60)
+    for _ in range(60):
+        limiter.reserve(1)
+    limiter.slow_down()
+    assert limiter.reserve(1) == pytest.approx(2, abs=0.1)
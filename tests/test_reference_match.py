@@ -1,6 +1,12 @@
 """Tests for reference matching functionality."""
 
-from src.reference_match import ReferenceMatch, find_markdown_references
+from src.reference_match import (
+    REFERENCE_RE,
+    ReferenceMatch,
+    _reference_matches,
+    find_markdown_references,
+    iter_markdown_references,
+)
 
 
 def test_find_markdown_references_basic() -> None:
@@ -95,10 +101,12 @@ def test_find_markdown_references_invalid_metadata() -> None:
     """Test handling of invalid metadata."""
     content = """
     Invalid metadata: [Doc](test.pdf)<!-- {not json} -->
+    Plain comment: [Doc](test.pdf)<!-- 42 -->
     """
 
     refs = find_markdown_references(content)
-    assert len(refs) == 1
+    assert len(refs) == 2
+    assert refs[1].metadata == {}
     assert refs[0] == ReferenceMatch(
         original_text="[Doc](test.pdf)<!-- {not json} -->",
         alt_text="Doc",
@@ -107,3 +115,43 @@ def test_find_markdown_references_invalid_metadata() -> None:
         is_image=False,
         metadata={},
     )
+
+
+def test_find_markdown_references_none() -> None:
+    """Test content without references, including near misses."""
+    assert find_markdown_references("Plain text with no links.") == []
+    assert find_markdown_references("[brackets] and (parens) [only]") == []
+
+
+def test_find_markdown_references_stray_brackets() -> None:
+    """Test that bracketed text before a link is not part of its alt text."""
+    refs = find_markdown_references("See [note] and [Doc](test.pdf) ![x] (y)")
+    assert [(ref.original_text, ref.alt_text) for ref in refs] == [
+        ("[Doc](test.pdf)", "Doc")
+    ]
+
+
+def test_iter_markdown_references() -> None:
+    """Test that references are yielded lazily in document order."""
+    refs = iter_markdown_references("[A](a.pdf) ![B](b.png)")
+    assert next(refs).link_path == "a.pdf"
+    assert next(refs).link_path == "b.png"
+    assert next(refs, None) is None
+
+
+def test_reference_match_hashable() -> None:
+    """Test that equal references deduplicate in a set."""
+    content = '[A](a.pdf) [A](a.pdf)<!-- {"embed": true} --> [A](a.pdf)'
+    refs = find_markdown_references(content)
+    assert len(refs) == 3
+    assert len(set(refs)) == 2
+
+
+def test_reference_scan_matches_regex() -> None:
+    """Test that the find-based scan yields exactly the regex's matches."""
+    content = (
+        "[a [b](x) ![c]\n[d](y)<!-- {} --> ](z) !![e](f) [g](h\n)"
+        '[i]](j) [k](l)<!--\n{"embed": false}\n-->'
+    )
+    expected = [m.span() for m in REFERENCE_RE.finditer(content)]
+    assert [m.span() for m in _reference_matches(content)] == expected